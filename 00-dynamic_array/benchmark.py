@@ -0,0 +1,93 @@
+# Benchmarks for DynamicArray, run with: python benchmark.py
+import random
+from timeit import timeit
+
+from gapBuffer import GapBuffer
+from main import DynamicArray
+
+
+# Dedup pipeline: one contains() per incoming record, add() when unseen.
+# Half of the records are duplicates
+def dedup(records, indexed):
+    seen = DynamicArray(indexed=indexed)
+    for record in records:
+        if not seen.contains(record):
+            seen.add(record)
+    return seen
+
+
+def bench_index_crossover():
+    print("dedup of n records (half duplicates), seconds per run")
+    print(f"{'n':>8} {'scan':>10} {'indexed':>10} {'speedup':>8}")
+    for n in (4, 8, 16, 32, 64, 128, 256, 1024, 4096):
+        records = [i // 2 for i in range(n)]
+        runs = max(1, 20000 // n)
+        scan = timeit(lambda: dedup(records, False), number=runs) / runs
+        indexed = timeit(lambda: dedup(records, True), number=runs) / runs
+        print(f"{n:>8} {scan:>10.6f} {indexed:>10.6f} {scan / indexed:>7.2f}x")
+
+
+# Editor-style workload: a cursor that drifts by a few positions between
+# edits, each edit an insert or a delete at the cursor
+def cursor_edits(n, edits, seed=1):
+    rng = random.Random(seed)
+    ops = []
+    cursor = n // 2
+    size = n
+    for _ in range(edits):
+        cursor = min(max(cursor + rng.randint(-3, 3), 0), size)
+        if size and cursor < size and rng.random() < 0.3:
+            ops.append((False, cursor))
+            size -= 1
+        else:
+            ops.append((True, cursor))
+            size += 1
+    return ops
+
+
+# The edits only, applied to a structure already holding 0..n-1
+def edit_gap_buffer(buf, ops):
+    for insert, cursor in ops:
+        if insert:
+            buf.insert_at(cursor, 0)
+        else:
+            buf.remove_at(cursor)
+
+
+def edit_dynamic_array(arr, ops):
+    for insert, cursor in ops:
+        if insert:
+            arr.insert_at(cursor, 0)
+        else:
+            arr.remove_at(cursor)
+
+
+def edit_list(lst, ops):
+    for insert, cursor in ops:
+        if insert:
+            lst.insert(cursor, 0)
+        else:
+            del lst[cursor]
+
+
+# Builds stay out of the timed region, only the edit loop is measured
+def bench_cursor_edits(edits=10000):
+    print(f"{edits} edits near a moving cursor, seconds")
+    print(f"{'n':>8} {'GapBuffer':>10} {'DynArray':>10} {'list':>10}")
+    for n in (1000, 10000, 100000):
+        ops = cursor_edits(n, edits)
+        buf = GapBuffer()
+        for i in range(n):
+            buf.add(i)
+        gap = timeit(lambda: edit_gap_buffer(buf, ops), number=1)
+        arr = DynamicArray()
+        arr.extend(range(n))
+        dyn = timeit(lambda: edit_dynamic_array(arr, ops), number=1)
+        plain = list(range(n))
+        lst = timeit(lambda: edit_list(plain, ops), number=1)
+        print(f"{n:>8} {gap:>10.4f} {dyn:>10.4f} {lst:>10.4f}")
+
+
+if __name__ == "__main__":
+    bench_index_crossover()
+    bench_cursor_edits()
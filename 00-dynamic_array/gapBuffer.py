@@ -0,0 +1,157 @@
+# Gap buffer: a dynamic array with a movable hole ("gap") of free slots.
+# Inserting or removing at the gap is O(1), moving the gap by d positions
+# costs one slice move of d elements. Edits that stay near a cursor, as in
+# a text editor, are O(1) amortized.
+class GapBuffer:
+    def __init__(self, capacity=16):
+
+        if capacity < 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        self.arr = [None] * capacity
+        self.gap_start = 0  # First free slot, also the cursor position
+        self.gap_end = capacity  # One past the last free slot
+        self.capacity = capacity
+
+    def size(self):
+        return self.capacity - (self.gap_end - self.gap_start)
+
+    def is_empty(self):
+        return self.size() == 0
+
+    def cursor(self):
+        return self.gap_start
+
+    # Physical slot holding the element at the given logical index
+    def _slot(self, index):
+        return index if index < self.gap_start else index + self.gap_end - self.gap_start
+
+    def get(self, index):
+        try:
+            if index < 0 or index >= self.size():
+                raise IndexError("Index out of bounds")
+            return self.arr[self._slot(index)]
+        except IndexError as e:
+            print("Error:", e)
+
+    def set(self, index, elem):
+        try:
+            if index < 0 or index >= self.size():
+                raise IndexError("Index out of bounds")
+            self.arr[self._slot(index)] = elem
+        except IndexError as e:
+            print("Error:", e)
+
+    # Move the gap so it starts at the given logical index
+    def move_cursor(self, index):
+        try:
+            if index < 0 or index > self.size():
+                raise IndexError("Index out of bounds")
+            start, end = self.gap_start, self.gap_end
+            if index < start:
+                # Elements [index, start) move to the right end of the gap
+                count = start - index
+                self.arr[end - count:end] = self.arr[index:start]
+                stop = min(start, end - count)
+                self.arr[index:stop] = [None] * (stop - index)
+            elif index > start:
+                # Elements after the gap move to its left end
+                count = index - start
+                self.arr[start:start + count] = self.arr[end:end + count]
+                begin = max(end, index)
+                self.arr[begin:end + count] = [None] * (end + count - begin)
+            self.gap_end = end + index - start
+            self.gap_start = index
+        except IndexError as e:
+            print("Error:", e)
+
+    def _grow(self):
+        capacity = 1 if self.capacity == 0 else self.capacity * 2
+        after = self.capacity - self.gap_end
+        new_arr = [None] * capacity
+        new_arr[:self.gap_start] = self.arr[:self.gap_start]
+        new_arr[capacity - after:] = self.arr[self.gap_end:]
+        self.arr = new_arr
+        self.gap_end = capacity - after
+        self.capacity = capacity
+
+    # Insert at the cursor and move the cursor past the new element
+    def insert(self, elem):
+        if self.gap_start == self.gap_end:
+            self._grow()
+        self.arr[self.gap_start] = elem
+        self.gap_start += 1
+
+    def insert_at(self, index, elem):
+        try:
+            if index < 0 or index > self.size():
+                raise IndexError("Index out of bounds")
+            self.move_cursor(index)
+            self.insert(elem)
+        except IndexError as e:
+            print("Error:", e)
+
+    def add(self, elem):
+        self.insert_at(self.size(), elem)
+
+    # Remove the element before the cursor (backspace)
+    def delete_before(self):
+        try:
+            if self.gap_start == 0:
+                raise IndexError("Nothing before the cursor")
+            self.gap_start -= 1
+            data = self.arr[self.gap_start]
+            self.arr[self.gap_start] = None
+            return data
+        except IndexError as e:
+            print("Error:", e)
+
+    # Remove the element after the cursor (delete)
+    def delete_after(self):
+        try:
+            if self.gap_end == self.capacity:
+                raise IndexError("Nothing after the cursor")
+            data = self.arr[self.gap_end]
+            self.arr[self.gap_end] = None
+            self.gap_end += 1
+            return data
+        except IndexError as e:
+            print("Error:", e)
+
+    def remove_at(self, rm_index):
+        try:
+            if rm_index < 0 or rm_index >= self.size():
+                raise IndexError("Index out of bounds")
+            self.move_cursor(rm_index)
+            return self.delete_after()
+        except IndexError as e:
+            print("Error:", e)
+
+    def clear(self):
+        self.arr = [None] * self.capacity
+        self.gap_start = 0
+        self.gap_end = self.capacity
+
+    def __iter__(self):
+        for i in range(self.gap_start):
+            yield self.arr[i]
+        for i in range(self.gap_end, self.capacity):
+            yield self.arr[i]
+
+    def __str__(self):
+        return "[" + ", ".join(map(str, self)) + "]"
+
+
+# Example usage:
+if __name__ == "__main__":
+    buf = GapBuffer()
+    for ch in "helo":
+        buf.insert(ch)
+    print(buf)  # Output: [h, e, l, o]
+    buf.insert_at(3, "l")
+    print(buf)  # Output: [h, e, l, l, o]
+    print(buf.cursor())  # Output: 4
+    buf.delete_before()
+    buf.insert("!")
+    print(buf)  # Output: [h, e, l, !, o]
+    print(buf.remove_at(0))  # Output: h
+    print(buf.get(0), buf.size())  # Output: e 4
@@ -1,11 +1,56 @@
+from bisect import insort
+
+
 class DynamicArray:
-    def __init__(self, capacity=16):
+    # indexed=True keeps a value -> positions dict next to the array so
+    # index_of / contains are O(1) on average. Elements must be hashable
+    def __init__(self, capacity=16, indexed=False):
 
         if capacity < 0:
             raise ValueError(f"Illegal Capacity: {capacity}")
         self.arr = [None] * capacity
         self.len = 0  # Length user thinks array is
         self.capacity = capacity
+        self.min_capacity = capacity  # Never shrink below the initial capacity
+        self._positions = None  # value -> ascending list of indexes
+        self._positions_stale = False
+        if indexed:
+            self.enable_index()
+
+    # ---- Secondary hash index ----
+
+    def enable_index(self):
+        self._positions = {}
+        self._rebuild_index()
+
+    def disable_index(self):
+        self._positions = None
+
+    def is_indexed(self):
+        return self._positions is not None
+
+    def _rebuild_index(self):
+        positions = {}
+        for i in range(self.len):
+            positions.setdefault(self.arr[i], []).append(i)
+        self._positions = positions
+        self._positions_stale = False
+
+    def _index_add(self, elem, i):
+        positions = self._positions.get(elem)
+        if positions is None:
+            self._positions[elem] = [i]
+        else:
+            insort(positions, i)
+
+    def _index_discard(self, elem, i):
+        positions = self._positions[elem]
+        if len(positions) == 1:
+            del self._positions[elem]
+        elif positions[-1] == i:
+            positions.pop()
+        else:
+            positions.remove(i)
 
     def size(self):
         return self.len
@@ -25,6 +70,9 @@ class DynamicArray:
         try:
             if index < 0 or index >= self.len:
                 raise IndexError("Index out of bounds")
+            if self._positions is not None and not self._positions_stale:
+                self._index_discard(self.arr[index], index)
+                self._index_add(elem, index)
             self.arr[index] = elem
         except IndexError as e:
             print("Error:", e)
@@ -33,35 +81,107 @@ class DynamicArray:
         for i in range(self.len):
             self.arr[i] = None
         self.len = 0
+        if self._positions is not None:
+            self._positions = {}
+            self._positions_stale = False
+
+    def _resize(self, capacity):
+        new_arr = [None] * capacity
+        new_arr[:self.len] = self.arr[:self.len]
+        self.arr = new_arr
+        self.capacity = capacity
+
+    # Double the capacity until min_capacity elements fit
+    def _ensure_capacity(self, min_capacity):
+        if min_capacity <= self.capacity:
+            return
+        capacity = 1 if self.capacity == 0 else self.capacity
+        while capacity < min_capacity:
+            capacity *= 2
+        self._resize(capacity)
+
+    # Halve the capacity once the array is only a quarter full. Growing at
+    # full and shrinking at a quarter leaves a gap, so alternating add and
+    # remove around a boundary never reallocates every call
+    def _maybe_shrink(self):
+        half = self.capacity // 2
+        if self.len <= self.capacity // 4 and half >= self.min_capacity:
+            while half > 1 and self.len <= half // 4 and half // 2 >= self.min_capacity:
+                half //= 2
+            self._resize(half)
 
     def add(self, elem):
         # Time to resize!
         if self.len >= self.capacity:
-            self.capacity = 1 if self.capacity == 0 else self.capacity * 2
-            new_arr = [None] * self.capacity
-            for i in range(self.len):
-                new_arr[i] = self.arr[i]
-            self.arr = new_arr
+            self._ensure_capacity(self.len + 1)
 
+        if self._positions is not None and not self._positions_stale:
+            self._index_add(elem, self.len)
         self.arr[self.len] = elem
         self.len += 1
 
+    def extend(self, iterable):
+        items = list(iterable)
+        n = len(items)
+        self._ensure_capacity(self.len + n)
+        if self._positions is not None and not self._positions_stale:
+            for i, elem in enumerate(items, self.len):
+                self._index_add(elem, i)
+        self.arr[self.len:self.len + n] = items
+        self.len += n
+
+    def insert_at(self, index, elem):
+        try:
+            if index < 0 or index > self.len:
+                raise IndexError("Index out of bounds")
+            self._ensure_capacity(self.len + 1)
+            # Shift the tail one slot to the right in a single slice move
+            self.arr[index + 1:self.len + 1] = self.arr[index:self.len]
+            self.arr[index] = elem
+            self.len += 1
+            if self._positions is not None:
+                if index == self.len - 1 and not self._positions_stale:
+                    self._index_add(elem, index)
+                else:
+                    self._positions_stale = True
+        except IndexError as e:
+            print("Error:", e)
+
     def remove_at(self, rm_index):
         try:
             if rm_index < 0 or rm_index >= self.len:
                 raise IndexError("Index out of bounds")
             data = self.arr[rm_index]
-            new_arr = [None] * (self.len - 1)
-            for i in range(self.len):
-                if i != rm_index:
-                    new_arr[i - (1 if i > rm_index else 0)] = self.arr[i]
-            self.arr = new_arr
-            self.capacity = self.len - 1
+            if self._positions is not None:
+                # Popping the last element shifts nothing, anything else
+                # moves later positions so the index is rebuilt on demand
+                if rm_index == self.len - 1 and not self._positions_stale:
+                    self._index_discard(data, rm_index)
+                else:
+                    self._positions_stale = True
+            self.arr[rm_index:self.len - 1] = self.arr[rm_index + 1:self.len]
+            self.arr[self.len - 1] = None
             self.len -= 1
+            self._maybe_shrink()
             return data
         except IndexError as e:
             print("Error:", e)
 
+    # Remove the elements in [start, stop)
+    def remove_range(self, start, stop):
+        try:
+            if start < 0 or stop > self.len or start > stop:
+                raise IndexError("Index out of bounds")
+            count = stop - start
+            if self._positions is not None and count:
+                self._positions_stale = True
+            self.arr[start:self.len - count] = self.arr[stop:self.len]
+            self.arr[self.len - count:self.len] = [None] * count
+            self.len -= count
+            self._maybe_shrink()
+        except IndexError as e:
+            print("Error:", e)
+
     def remove(self, obj):
         index = self.index_of(obj)
         if index == -1:
@@ -70,6 +190,11 @@ class DynamicArray:
         return True
 
     def index_of(self, obj):
+        if self._positions is not None:
+            if self._positions_stale:
+                self._rebuild_index()
+            positions = self._positions.get(obj)
+            return positions[0] if positions else -1
         for i in range(self.len):
             if obj is None:
                 if self.arr[i] is None:
@@ -105,7 +230,7 @@ class DynamicArray:
 
 # Example usage:
 if __name__ == "__main__":
-    arr = DynamicArray(-50)
+    arr = DynamicArray(50)
     arr.add(1)
     arr.add(2)
     arr.add(3)
@@ -114,12 +239,24 @@ if __name__ == "__main__":
     print(arr)  # Output: [1, 3]
     print(arr.contains(2))  # Output: False
     print(arr.size())  # Output: 2
+    arr.extend([4, 5, 6])
+    arr.insert_at(1, 2)
+    print(arr)  # Output: [1, 2, 3, 4, 5, 6]
+    arr.remove_range(2, 5)
+    print(arr)  # Output: [1, 2, 6]
+
+    seen = DynamicArray(indexed=True)
+    for record in ["a", "b", "a", "c", "b"]:
+        if not seen.contains(record):
+            seen.add(record)
+    print(seen)  # Output: [a, b, c]
+    print(seen.index_of("c"))  # Output: 2
 
-# Original dictionary
-list_ = {"fname": "me", "lname": "me", "email": "me", "password": "me"}
+    # Original dictionary
+    list_ = {"fname": "me", "lname": "me", "email": "me", "password": "me"}
 
-# Unpack the dictionary to separate 'password' and the rest of the dictionary
-restoflist = {key: value for key, value in list_.items() if key != "password"}
+    # Unpack the dictionary to separate 'password' and the rest of the dictionary
+    restoflist = {key: value for key, value in list_.items() if key != "password"}
 
-# Output the rest of the dictionary
-print(restoflist)  # Output: {'fname': 'me', 'lname': 'me', 'email': 'me'}
+    # Output the rest of the dictionary
+    print(restoflist)  # Output: {'fname': 'me', 'lname': 'me', 'email': 'me'}
@@ -1,26 +1,162 @@
+import mmap
+import os
+from array import array as _array
+from bisect import bisect_left
+from operator import le
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional, bulk operations fall back to pure Python
+    _np = None
+
+# Integer typecodes accepted for the compact (buffer-backed) storage mode
+INT_TYPECODES = "bBhHiIlLqQ"
+
+
 class IntArray:
-    def __init__(self, capacity=16):
+    # Bulk operations (sum, min, max, filter, ...) run vectorized through
+    # NumPy when it is installed. Set to False to force the Python loops
+    use_numpy = _np is not None
+
+    # typecode=None keeps the plain list storage, otherwise the elements
+    # live in an array.array of that typecode ('q', 'i', ...)
+    def __init__(self, capacity=16, typecode=None):
 
         if capacity < 0:
             raise ValueError(f"Illegal Capacity: {capacity}")
+        if typecode is not None and typecode not in INT_TYPECODES:
+            raise ValueError(f"Illegal typecode: {typecode}")
+        self.typecode = typecode
         self.capacity = capacity
-        self.arr = [0] * capacity
+        self.arr = self._alloc(capacity)
+        self._file = None  # Set when backed by a memory-mapped file
+        self._mmap = None
         self.len = 0
+        # True while the elements are known to be in ascending order. sort()
+        # sets it, set() / reverse() clear it, add() keeps it when appending
+        # in order and removals cannot break it
+        self.sorted = True
+
+    # Zero filled backing store of the given capacity
+    def _alloc(self, capacity):
+        if self.typecode is None:
+            return [0] * capacity
+        return _array(self.typecode, bytes(capacity * _array(self.typecode).itemsize))
 
     # Initialize with an existing array
 
     @classmethod
-    def from_array(cls, array):
+    def from_array(cls, array, typecode=None):
         try:
             if array is None:
                 raise ValueError("Array cannot be null")
-            int_array = cls(len(array))
-            int_array.arr = array[:]
+            int_array = cls(0, typecode)
+            if typecode is None:
+                int_array.arr = array[:]
+            else:
+                int_array.arr = _array(typecode, array)
             int_array.len = int_array.capacity = len(array)
+            int_array.sorted = int_array._is_sorted()
             return int_array
         except ValueError as e:
             print("Error:", e)
 
+    # Back an IntArray with a memory-mapped flat binary file of `typecode`
+    # integers in native byte order. Elements are read and written straight
+    # on the mapped pages, nothing is loaded up front.
+    #   mode "r"  : read only
+    #   mode "r+" : read / write an existing file
+    #   mode "w+" : create (or truncate) the file
+    # add() grows the file geometrically, close() trims the unused capacity
+    # back off so the file holds exactly size() elements again. The sorted
+    # flag is not computed on open (that would scan the whole file), pass
+    # assume_sorted=True for files known to be in ascending order
+    @classmethod
+    def open_mmap(cls, path, typecode="q", mode="r+", assume_sorted=False):
+        if mode not in ("r", "r+", "w+"):
+            raise ValueError(f"Illegal mode: {mode}")
+        if not isinstance(typecode, str) or len(typecode) != 1 or typecode not in INT_TYPECODES:
+            raise ValueError(f"Illegal typecode: {typecode}")
+        int_array = cls(0, typecode)
+        f = open(path, mode + "b" if mode != "r" else "rb")
+        nbytes = os.fstat(f.fileno()).st_size
+        itemsize = int_array.arr.itemsize
+        if nbytes % itemsize:
+            # Not a file of whole elements, refuse rather than cut it short
+            f.close()
+            raise ValueError(f"File size {nbytes} is not a multiple of the "
+                             f"{itemsize} byte '{typecode}' item size")
+        int_array._file = f
+        int_array._access = mmap.ACCESS_READ if mode == "r" else mmap.ACCESS_WRITE
+        n = nbytes // itemsize
+        int_array._map(n)
+        int_array.len = n
+        int_array.sorted = n < 2 or assume_sorted
+        return int_array
+
+    # (Re)map the backing file with room for `capacity` elements
+    def _map(self, capacity):
+        old_mmap = self._mmap
+        if isinstance(self.arr, memoryview):
+            self.arr.release()
+        nbytes = capacity * _array(self.typecode).itemsize
+        if self._access != mmap.ACCESS_READ:
+            if os.fstat(self._file.fileno()).st_size != nbytes:
+                self._file.truncate(nbytes)
+        if nbytes == 0:
+            # mmap cannot map an empty file
+            self._mmap, self.arr = None, _array(self.typecode)
+        else:
+            self._mmap = mmap.mmap(self._file.fileno(), nbytes, access=self._access)
+            self.arr = memoryview(self._mmap).cast(self.typecode)
+        self.capacity = capacity
+        if old_mmap is not None:
+            try:
+                old_mmap.close()
+            except BufferError:
+                pass  # Views handed out earlier keep the old mapping alive
+
+    def is_mapped(self):
+        return self._file is not None
+
+    def flush(self):
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    # Unmap and close the backing file, dropping any spare capacity
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        if self._access != mmap.ACCESS_READ and self.capacity != self.len:
+            self._map(self.len)
+        if isinstance(self.arr, memoryview):
+            self.arr.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+        self._file.close()
+        self._file = self._mmap = None
+        self.arr, self.len, self.capacity = self._alloc(0), 0, 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _is_sorted(self):
+        if self.len < 2:
+            return True
+        # A list would be converted element by element anyway (and may hold
+        # ints beyond int64), so only typed storage goes through NumPy
+        if self.typecode is not None and self.use_numpy:
+            values = self._ndarray()
+            return bool((values[:-1] <= values[1:]).all())
+        return all(map(le, self.arr[:self.len - 1], self.arr[1:self.len]))
+
     def size(self):
         return self.len
 
@@ -40,16 +176,26 @@ class IntArray:
             if index < 0 or index >= self.len:
                 raise IndexError("Index out of bounds")
             self.arr[index] = elem
+            self.sorted = False
         except IndexError as e:
             print("Error:", e)
 
     def add(self, elem):
         if self.len >= self.capacity:
-            self.capacity = 1 if self.capacity == 0 else self.capacity * 2
-            new_arr = [0] * self.capacity
-            for i in range(self.len):
-                new_arr[i] = self.arr[i]
-            self.arr = new_arr
+            capacity = 1 if self.capacity == 0 else self.capacity * 2
+            if self._file is not None:
+                # Check before _map() releases the current view
+                if self._access == mmap.ACCESS_READ:
+                    raise TypeError("Cannot add to an IntArray mapped read only (mode 'r')")
+                self._map(capacity)
+            else:
+                self.capacity = capacity
+                # Copy into a fresh store so views handed out earlier stay valid
+                new_arr = self._alloc(self.capacity)
+                new_arr[:self.len] = self.arr[:self.len]
+                self.arr = new_arr
+        if self.sorted and self.len > 0 and elem < self.arr[self.len - 1]:
+            self.sorted = False
         self.arr[self.len] = elem
         self.len += 1
 
@@ -57,27 +203,46 @@ class IntArray:
         try:
             if rm_index < 0 or rm_index >= self.len:
                 raise IndexError("Index out of bounds")
-            for i in range(rm_index, self.len - 1):
-                self.arr[i] = self.arr[i + 1]
+            self.arr[rm_index:self.len - 1] = self.arr[rm_index + 1:self.len]
             self.arr[self.len - 1] = 0
             self.len -= 1
         except IndexError as e:
             print("Error:", e)
 
     def remove(self, elem):
-        for i in range(self.len):
-            if self.arr[i] == elem:
-                self.remove_at(i)
-                return True
-        return False
+        index = self.index_of(elem)
+        if index == -1:
+            return False
+        self.remove_at(index)
+        return True
+
+    # First index of elem, O(log n) when the array is known to be sorted
+    def index_of(self, elem):
+        if self.sorted:
+            try:
+                i = bisect_left(self.arr, elem, 0, self.len)
+            except TypeError:
+                return -1  # Doesn't compare with ints (None, str...), never stored
+            return i if i < self.len and self.arr[i] == elem else -1
+        if isinstance(self.arr, memoryview):
+            for i, x in enumerate(self.arr[:self.len]):
+                if x == elem:
+                    return i
+            return -1
+        try:
+            return self.arr.index(elem, 0, self.len)
+        except ValueError:
+            return -1
+
+    def contains(self, elem):
+        return self.index_of(elem) != -1
 
     def reverse(self):
-        for i in range(self.len // 2):
-            tmp = self.arr[i]
-            self.arr[i] = self.arr[self.len - i - 1]
-            self.arr[self.len - i - 1] = tmp
+        self.arr[:self.len] = self.arr[:self.len][::-1]
+        self.sorted = self.len < 2
 
     def binary_search(self, key):
+        assert self.sorted, "binary_search() needs a sorted array, call sort() first"
         low, high = 0, self.len - 1
         while low <= high:
             mid = (low + high) // 2
@@ -91,7 +256,255 @@ class IntArray:
         return -1  # Not found
 
     def sort(self):
-        self.arr[:self.len] = sorted(self.arr[:self.len])
+        if self.typecode is None:
+            self.arr[:self.len] = sorted(self.arr[:self.len])
+        elif self.use_numpy:
+            self._ndarray().sort()  # In place, no temporary list of PyLongs
+        else:
+            self.arr[:self.len] = _array(self.typecode, sorted(self.arr[:self.len]))
+        self.sorted = True
+
+    # Leftmost index of every key (-1 when missing) in one call.
+    # NumPy resolves the whole batch with searchsorted when every key is an
+    # int of the elements' dtype. Otherwise sorted keys are answered with a
+    # merge walk (or a bisect that never looks left of the previous answer
+    # when the batch is small), unsorted keys with one bisect each. Keys
+    # are compared exactly, 1.5 is never found and None or "x" give -1
+    def search_many(self, keys):
+        assert self.sorted, "search_many() needs a sorted array, call sort() first"
+        n = self.len
+        keys = list(keys)
+        values = self._numpy_values()
+        if values is not None and all(isinstance(key, int) for key in keys):
+            try:
+                key_values = _np.array(keys, dtype=values.dtype)
+            except OverflowError:
+                key_values = None  # Out of the dtype's range, never casted
+            if key_values is not None:
+                idx = _np.searchsorted(values, key_values)
+                found = idx < n
+                found[found] = values[idx[found]] == key_values[found]
+                return _np.where(found, idx, -1).tolist()
+
+        values = self.arr
+        try:
+            if all(map(le, keys[:-1], keys[1:])):
+                result = []
+                i = 0
+                if len(keys) * max(n.bit_length(), 1) >= n:
+                    for key in keys:
+                        while i < n and values[i] < key:
+                            i += 1
+                        result.append(i if i < n and values[i] == key else -1)
+                else:
+                    for key in keys:
+                        i = bisect_left(values, key, i, n)
+                        result.append(i if i < n and values[i] == key else -1)
+                return result
+        except TypeError:
+            pass  # A key doesn't compare with ints, answer them one by one
+        result = []
+        for key in keys:
+            try:
+                i = bisect_left(values, key, 0, n)
+            except TypeError:
+                result.append(-1)
+                continue
+            result.append(i if i < n and values[i] == key else -1)
+        return result
+
+    # Zero-copy view of the used part of a typed backing store.
+    # The view stays bound to the current buffer, so it goes stale
+    # (but stays safe) once add() has to grow the array
+    def view(self):
+        if self.typecode is None:
+            raise TypeError("view() requires a typed IntArray")
+        return memoryview(self.arr)[:self.len]
+
+    # Buffer protocol (Python 3.12+), memoryview(int_array) works directly
+    def __buffer__(self, flags):
+        return self.view()
+
+    def __len__(self):
+        return self.len
+
+    # ---- Bulk operations ----
+
+    # NumPy view of the elements. Typed storage is wrapped without copying,
+    # list storage has to be converted
+    def _ndarray(self):
+        if self.typecode is None:
+            return _np.array(self.arr[:self.len], dtype=_np.int64)
+        return _np.frombuffer(self.arr, dtype=self.typecode, count=self.len)
+
+    # _ndarray() when the NumPy path can be taken, None when it is turned
+    # off or a list element does not fit in int64 (the Python loops are
+    # exact for any int)
+    def _numpy_values(self):
+        if not self.use_numpy:
+            return None
+        try:
+            return self._ndarray()
+        except OverflowError:
+            return None
+
+    # Largest absolute value of a non-empty ndarray, as a Python int
+    @staticmethod
+    def _abs_bound(values):
+        return max(-int(values.min()), int(values.max()))
+
+    # New IntArray with the same storage mode holding the given values
+    def _new_like(self, values):
+        if _np is not None and isinstance(values, _np.ndarray):
+            if self.typecode is None:
+                values = values.tolist()
+            else:
+                values = _array(self.typecode, values.astype(self.typecode).tobytes())
+        return IntArray.from_array(values, self.typecode)
+
+    # NumPy accumulates in 64 bits, which is only used when no partial sum
+    # can overflow; otherwise the exact Python sum is taken
+    def sum(self):
+        values = self._numpy_values()
+        if values is not None and self.len:
+            if self._abs_bound(values) * self.len <= 2 ** 63 - 1:
+                return int(values.sum(dtype=_np.int64))
+            if values.dtype.kind == "u" and int(values.max()) * self.len <= 2 ** 64 - 1:
+                return int(values.sum(dtype=_np.uint64))
+        return sum(self.arr[:self.len])
+
+    def min(self):
+        try:
+            if self.len == 0:
+                raise ValueError("Array is empty")
+            values = self._numpy_values()
+            if values is not None:
+                return int(values.min())
+            return min(self.arr[:self.len])
+        except ValueError as e:
+            print("Error:", e)
+
+    def max(self):
+        try:
+            if self.len == 0:
+                raise ValueError("Array is empty")
+            values = self._numpy_values()
+            if values is not None:
+                return int(values.max())
+            return max(self.arr[:self.len])
+        except ValueError as e:
+            print("Error:", e)
+
+    # Keep the elements selected by predicate_mask, either a sequence of
+    # booleans (one per element) or a callable such as `lambda x: x > 5`.
+    # With NumPy the callable is applied once to the whole array, so it
+    # must be written with element-wise operators
+    def filter(self, predicate_mask):
+        values = self._numpy_values()
+        if values is not None:
+            if callable(predicate_mask):
+                mask = predicate_mask(values)
+            else:
+                mask = _np.asarray(predicate_mask, dtype=bool)
+            return self._new_like(values[mask])
+        values = self.arr[:self.len]
+        if callable(predicate_mask):
+            return self._new_like([x for x in values if predicate_mask(x)])
+        return self._new_like([x for x, keep in zip(values, predicate_mask) if keep])
+
+    # New array holding scale * x + offset for every element x. scale and
+    # offset must be ints; results that don't fit the typecode raise
+    # OverflowError, the same as storing them one by one would
+    def map_affine(self, scale, offset=0):
+        if not isinstance(scale, int) or not isinstance(offset, int):
+            raise TypeError("scale and offset must be integers")
+        values = self._numpy_values()
+        # int64 arithmetic wraps silently, only use it when nothing can
+        if (values is not None and self.len
+                and self._abs_bound(values) * abs(scale) + abs(offset) <= 2 ** 63 - 1):
+            result = values.astype(_np.int64) * scale + offset
+            if self.typecode is not None:
+                info = _np.iinfo(self.typecode)
+                if int(result.min()) < info.min or int(result.max()) > info.max:
+                    raise OverflowError(f"Result out of range for typecode '{self.typecode}'")
+            return self._new_like(result)
+        return self._new_like([scale * x + offset for x in self.arr[:self.len]])
+
+    # Indexes that would sort the array (stable)
+    def argsort(self):
+        typecode = None if self.typecode is None else "q"
+        values = self._numpy_values()
+        if values is not None:
+            order = values.argsort(kind="stable")
+            if typecode is None:
+                return IntArray.from_array(order.tolist())
+            return IntArray.from_array(_array("q", order.astype(_np.int64).tobytes()), typecode)
+        values = self.arr
+        return IntArray.from_array(sorted(range(self.len), key=values.__getitem__), typecode)
+
+    # Counts of the elements in `bins` equal width bins spanning [min, max]
+    # (or the given value_range). Returns (counts, edges) like numpy.histogram
+    def histogram(self, bins=10, value_range=None):
+        if bins <= 0:
+            raise ValueError(f"Illegal number of bins: {bins}")
+        if value_range is not None and value_range[0] > value_range[1]:
+            raise ValueError(f"Illegal value range: {value_range}")
+        values = self._numpy_values()
+        if values is not None:
+            try:
+                counts, edges = _np.histogram(values, bins, value_range)
+                return counts.tolist(), edges.tolist()
+            except ValueError:
+                pass  # Range too narrow for float64 above 2**53, count in Python
+        values = self.arr[:self.len]
+        if value_range is not None:
+            lo, hi = value_range
+        elif values:
+            lo, hi = min(values), max(values)
+        else:
+            lo, hi = 0, 1
+        # An empty range is widened by 1/2 on each side, like NumPy does. The
+        # bounds stay exact, lo - 0.5 is rounded away above 2**53
+        pad = 0.5 if lo == hi else 0
+        width = (hi - lo + 2 * pad) / bins
+        edges = [lo - pad + i * width for i in range(bins)] + [float(hi + pad)]
+        counts = [0] * bins
+        for x in values:
+            if -pad <= x - lo and x - hi <= pad:
+                i = int((x - lo + pad) / width)
+                counts[i if i < bins else bins - 1] += 1
+        return counts, edges
+
+    # New array holding the elements at the given indexes
+    def take(self, indices):
+        try:
+            values = self._numpy_values()
+            if values is not None:
+                try:
+                    idx = _np.asarray(indices, dtype=_np.int64)
+                except OverflowError:
+                    raise IndexError("Index out of bounds") from None
+                if idx.size and (idx.min() < 0 or idx.max() >= self.len):
+                    raise IndexError("Index out of bounds")
+                return self._new_like(values[idx])
+            values = self.arr
+            result = []
+            for i in indices:
+                if i < 0 or i >= self.len:
+                    raise IndexError("Index out of bounds")
+                result.append(values[i])
+            return self._new_like(result)
+        except IndexError as e:
+            print("Error:", e)
+
+    # Integer indexes behave like get(), slices return a memoryview
+    # in typed mode and a copied list otherwise
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if self.typecode is None:
+                return self.arr[:self.len][index]
+            return self.view()[index]
+        return self.get(index)
 
     def __iter__(self):
         self._index = 0
@@ -125,3 +538,24 @@ if __name__ == "__main__":
         print(ar.get(i))  # Prints -2, 3, 6, 7
 
     print(ar)  # Prints [-2, 3, 6, 7]
+
+    compact = IntArray(4, "q")
+    for v in (5, 1, 4):
+        compact.add(v)
+    compact.sort()
+    print(compact)  # Prints [1, 4, 5]
+    print(compact.binary_search(4))  # Prints 1
+    print(compact.search_many([1, 2, 5]))  # Prints [0, -1, 2]
+    print(compact[1:].tolist())  # Prints [4, 5] (memoryview, no copy)
+
+    print(compact.sum(), compact.min(), compact.max())  # Prints 10 1 5
+    print(compact.filter(lambda x: x > 1))  # Prints [4, 5]
+    print(compact.map_affine(2, 1))  # Prints [3, 9, 11]
+    print(compact.take([2, 0]))  # Prints [5, 1]
+
+    with IntArray.open_mmap("ints.bin", "q", "w+") as mapped:
+        for v in (30, 10, 20):
+            mapped.add(v)
+        mapped.sort()
+        print(mapped, mapped.binary_search(20))  # Prints [10, 20, 30] 1
+    os.remove("ints.bin")
@@ -1,16 +1,56 @@
+# Bounded free list of recycled nodes. Popped / removed nodes are kept
+# (up to max_size) and handed out again instead of allocating new ones
+class NodePool:
+    def __init__(self, node_class, max_size=1024):
+        self.node_class = node_class
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0  # Nodes served from the free list
+        self.misses = 0  # Nodes that had to be allocated
+
+    def acquire(self, data):
+        if self.free:
+            self.hits += 1
+            node = self.free.pop()
+            node.data = data
+            return node
+        self.misses += 1
+        return self.node_class(data)
+
+    def release(self, node):
+        node.data = None  # Don't keep the element alive
+        node.next = None
+        if len(self.free) < self.max_size:
+            self.free.append(node)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
 class LinkedList:
 
-    def __init__(self, first_elem=None):
+    # pool_size > 0 recycles removed nodes through a NodePool of that size
+    def __init__(self, first_elem=None, pool_size=0):
+        self.pool = NodePool(self.Node, pool_size) if pool_size > 0 else None
         self.head = self.Node(
             first_elem) if first_elem is not None else first_elem
         self.size = 1 if first_elem is not None else 0
         self.tail = self.head if self.head is not None else None
 
     class Node:
+        __slots__ = ("data", "next")  # No per-node __dict__
+
         def __init__(self, data=None):
             self.data = data  # The value stored in the node
             self.next = None  # Pointer to the next node
-    # Append a new node with the given data at the end of the list
+
+    # Build a list from any iterable in one pass
+    @classmethod
+    def from_iterable(cls, iterable):
+        ll = cls()
+        ll.extend(iterable)
+        return ll
 
     def clear(self):
         trav = self.head
@@ -18,6 +58,8 @@ class LinkedList:
             next_node = trav.next
             trav.next = None
             trav.data = None
+            if self.pool:
+                self.pool.release(trav)
             trav = next_node
         self.head = self.tail = trav = None
         self.size = 0
@@ -30,36 +72,60 @@ class LinkedList:
     def Size(self):
         return self.size
 
+    # Append a new node with the given data at the end of the list
     def append(self, data):
-        new_node = self.Node(data)
+        new_node = self.pool.acquire(data) if self.pool else self.Node(data)
         if self.head is None:
             self.head = new_node  # If the list is empty, make the new node the head
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node  # Link the last node to the new node
+            self.tail.next = new_node  # Link the last node to the new node
+        self.tail = new_node
         self.size += 1
 
+    # Append every element of the iterable, linking the nodes in one pass
+    def extend(self, iterable):
+        make_node = self.pool.acquire if self.pool else self.Node
+        dummy = self.Node()
+        last = dummy
+        count = 0
+        for data in iterable:
+            node = make_node(data)
+            last.next = node
+            last = node
+            count += 1
+        if count == 0:
+            return
+        if self.head is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = last
+        self.size += count
+
     # Insert a new node with the given data at the specified index
     def insert(self, data, index):
         try:
             if index < 0:
                 raise IndexError("Index out of bounds")
 
-            new_node = self.Node(data)
+            if index > self.size:
+                raise IndexError("Index out of bounds")
+
+            new_node = self.pool.acquire(data) if self.pool else self.Node(data)
             if index == 0:
                 new_node.next = self.head
                 self.head = new_node  # Insert at the beginning
+            elif index == self.size:
+                self.tail.next = new_node  # Insert at the end
             else:
                 current = self.head
                 for i in range(index - 1):
-                    if current is None:
-                        raise IndexError("Index out of bounds")
                     current = current.next
 
                 new_node.next = current.next
                 current.next = new_node
+            if new_node.next is None:
+                self.tail = new_node
             self.size += 1
         except IndexError as e:
             print("Error:", e)
@@ -75,10 +141,15 @@ class LinkedList:
                     previous.next = current.next  # Bypass the current node
                 else:
                     self.head = current.next  # Remove the head
-                return current.data
+                if current is self.tail:
+                    self.tail = previous
+                self.size -= 1
+                data = current.data
+                if self.pool:
+                    self.pool.release(current)
+                return data
             previous = current
             current = current.next
-        self.size -= 1
 
         return None
 
@@ -148,3 +219,8 @@ if __name__ == "__main__":
     ll.clear()
     print(ll.Size())  # Output: 0
     print(ll.is_empty())  # true
+
+    ll = LinkedList.from_iterable(range(3))
+    ll.extend([3, 4])
+    ll.append(5)
+    ll.display()  # Output: [0, 1, 2, 3, 4, 5]
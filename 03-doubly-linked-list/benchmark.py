@@ -0,0 +1,128 @@
+# Benchmarks for the doubly linked list variants, run with: python benchmark.py
+import random
+import tracemalloc
+from timeit import timeit
+
+from cursorLinkedList import CursorLinkedList
+from main import DoublyLinkedList
+from skipList import IndexableSkipList
+from unrolledLinkedList import UnrolledLinkedList
+
+
+# DoublyLinkedList has no get(), walk from the closer end like remove_at does
+def dll_get(dll, index):
+    if index < dll.size / 2:
+        trav = dll.head
+        for _ in range(index):
+            trav = trav.next
+    else:
+        trav = dll.tail
+        for _ in range(dll.size - 1, index, -1):
+            trav = trav.prev
+    return trav.data
+
+
+def build(cls, n):
+    lst = cls()
+    for i in range(n):
+        lst.add_last(i)
+    return lst
+
+
+def bytes_per_element(cls, n):
+    tracemalloc.start()
+    lst = build(cls, n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del lst
+    return size / n
+
+
+def bench(n=100000, lookups=200):
+    rng = random.Random(1)
+    indexes = [rng.randrange(n) for _ in range(lookups)]
+    dll = build(DoublyLinkedList, n)
+    ull = build(UnrolledLinkedList, n)
+
+    print(f"n = {n}")
+    print(f"{'':<24} {'Doubly':>10} {'Unrolled':>10}")
+    print(f"{'build (s)':<24} {timeit(lambda: build(DoublyLinkedList, n), number=1):>10.4f}"
+          f" {timeit(lambda: build(UnrolledLinkedList, n), number=1):>10.4f}")
+    print(f"{'iterate (s)':<24} {timeit(lambda: sum(dll), number=5) / 5:>10.4f}"
+          f" {timeit(lambda: sum(ull), number=5) / 5:>10.4f}")
+    print(f"{f'{lookups} get(i) (s)':<24}"
+          f" {timeit(lambda: [dll_get(dll, i) for i in indexes], number=1):>10.4f}"
+          f" {timeit(lambda: [ull.get(i) for i in indexes], number=1):>10.4f}")
+    print(f"{'bytes per element':<24} {bytes_per_element(DoublyLinkedList, n):>10.1f}"
+          f" {bytes_per_element(UnrolledLinkedList, n):>10.1f}")
+
+
+# Random positional inserts followed by random positional removals. The
+# skip list is seeded so its tower heights are the same on every run
+def bench_positional(n=20000, ops=2000, seed=1):
+    rng = random.Random(seed)
+    inserts = [rng.randrange(n) for _ in range(ops)]
+    removals = [rng.randrange(n) for _ in range(ops)]
+
+    def run_dll():
+        dll = build(DoublyLinkedList, n)
+        for i in inserts:
+            dll_get(dll, i)  # Walk to the position, DoublyLinkedList has no insert_at
+            dll.add_last(i)
+        for i in removals:
+            dll.remove_at(i)
+
+    def run_skip_list():
+        sl = IndexableSkipList(seed=seed)
+        for i in range(n):
+            sl.add_last(i)
+        for i in inserts:
+            sl.insert_at(i, i)
+        for i in removals:
+            sl.remove_at(i)
+
+    print(f"n = {n}, {ops} insert_at + {ops} remove_at at random positions (s)")
+    print(f"{'Doubly':>10} {'SkipList':>10}")
+    print(f"{timeit(run_dll, number=1):>10.4f} {timeit(run_skip_list, number=1):>10.4f}")
+
+
+# Object-per-node DoublyLinkedList vs the struct-of-arrays CursorLinkedList.
+# Elements are one shared object so only the list structure is measured
+def bench_cursor(n=200000):
+    def build_same(cls):
+        lst = cls()
+        elem = object()
+        for _ in range(n):
+            lst.add_last(elem)
+        return lst
+
+    def churn(lst):
+        for _ in range(n):
+            lst.add_last(lst.remove_first())
+
+    def structure_bytes(cls):
+        tracemalloc.start()
+        lst = build_same(cls)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del lst
+        return size / n
+
+    dll = build_same(DoublyLinkedList)
+    cll = build_same(CursorLinkedList)
+    print(f"n = {n}, object-based vs cursor-based")
+    print(f"{'':<24} {'Doubly':>10} {'Cursor':>10}")
+    print(f"{'bytes per element':<24} {structure_bytes(DoublyLinkedList):>10.1f}"
+          f" {structure_bytes(CursorLinkedList):>10.1f}")
+    print(f"{'build (s)':<24} {timeit(lambda: build_same(DoublyLinkedList), number=1):>10.4f}"
+          f" {timeit(lambda: build_same(CursorLinkedList), number=1):>10.4f}")
+    print(f"{'iterate (s)':<24} {timeit(lambda: sum(1 for _ in dll), number=1):>10.4f}"
+          f" {timeit(lambda: sum(1 for _ in cll), number=1):>10.4f}")
+    print(f"{'remove+add churn (s)':<24} {timeit(lambda: churn(dll), number=1):>10.4f}"
+          f" {timeit(lambda: churn(cll), number=1):>10.4f}")
+
+
+if __name__ == "__main__":
+    bench()
+    bench_positional()
+    bench_cursor()
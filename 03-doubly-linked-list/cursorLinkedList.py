@@ -0,0 +1,304 @@
+# data structures - cursor (struct-of-arrays) doubly linked list
+# Same operations as DoublyLinkedList, but there are no Node objects: slot i
+# of the list is data[i] with its links in next[i] / prev[i], two parallel
+# array('l') columns. A handle is just the slot number (an int), NIL (-1)
+# marks the end of a chain. Free slots are chained through `next`, so
+# removing and re-adding elements recycles slots without allocating.
+# Every list owns its arrays, so the operations that move elements between
+# lists (concat, splice, split_at) copy them, O(k) for k moved elements,
+# where DoublyLinkedList just relinks its nodes in O(1).
+from array import array
+
+NIL = -1
+
+
+class CursorLinkedList:
+    def __init__(self, first_elem=None, capacity=16):
+        if capacity < 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        self.data = []
+        self.next = array("l")
+        self.prev = array("l")
+        self.capacity = 0
+        self.free = NIL  # First free slot
+        self.head = self.tail = NIL
+        self.size = 0
+        self._grow(max(capacity, 1))
+        if first_elem is not None:
+            self.add_last(first_elem)
+
+    # Add slots [capacity, new_capacity) to the free chain
+    def _grow(self, new_capacity):
+        old = self.capacity
+        self.data.extend([None] * (new_capacity - old))
+        self.next.extend(range(old + 1, new_capacity + 1))
+        self.next[new_capacity - 1] = self.free
+        self.prev.extend([NIL] * (new_capacity - old))
+        self.free = old
+        self.capacity = new_capacity
+
+    def _alloc(self, elem):
+        if self.free == NIL:
+            self._grow(self.capacity * 2)
+        slot = self.free
+        self.free = self.next[slot]
+        self.data[slot] = elem
+        return slot
+
+    def _release(self, slot):
+        self.data[slot] = None
+        self.prev[slot] = NIL
+        self.next[slot] = self.free
+        self.free = slot
+
+    def clear(self):
+        slot = self.head
+        while slot != NIL:
+            following = self.next[slot]
+            self._release(slot)
+            slot = following
+        self.head = self.tail = NIL
+        self.size = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def Size(self):
+        return self.size
+
+    # The add methods return the slot (handle) of the new element
+    def add(self, elem):
+        return self.add_last(elem)
+
+    def add_last(self, elem):
+        slot = self._alloc(elem)
+        self.prev[slot] = self.tail
+        self.next[slot] = NIL
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self.next[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+        return slot
+
+    def add_first(self, elem):
+        slot = self._alloc(elem)
+        self.prev[slot] = NIL
+        self.next[slot] = self.head
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self.prev[self.head] = slot
+        self.head = slot
+        self.size += 1
+        return slot
+
+    # Element stored at a handle
+    def value_at(self, slot):
+        return self.data[slot]
+
+    def move_to_front(self, slot):
+        if slot == self.head:
+            return
+        nxt, prv = self.next[slot], self.prev[slot]
+        self.next[prv] = nxt
+        if nxt == NIL:
+            self.tail = prv
+        else:
+            self.prev[nxt] = prv
+        self.prev[slot] = NIL
+        self.next[slot] = self.head
+        self.prev[self.head] = slot
+        self.head = slot
+
+    # Link a new element right after `slot` (to the front when slot is NIL)
+    def _insert_after(self, slot, elem):
+        if slot == NIL:
+            return self.add_first(elem)
+        if slot == self.tail:
+            return self.add_last(elem)
+        new = self._alloc(elem)
+        nxt = self.next[slot]
+        self.prev[new] = slot
+        self.next[new] = nxt
+        self.next[slot] = new
+        self.prev[nxt] = new
+        self.size += 1
+        return new
+
+    def concat(self, other):
+        self.splice(self.tail, other)
+
+    # Copy every element of `other` right after `slot` (to the front when
+    # slot is NIL) and empty it. The slots live in other's arrays, so
+    # unlike DoublyLinkedList.splice this is O(k)
+    def splice(self, slot, other):
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        for elem in other:
+            slot = self._insert_after(slot, elem)
+        other.clear()
+
+    # Cut the list right before `slot` and return slot..tail as a new list.
+    # Unlinking is O(1), but the elements have to be copied into the new
+    # list's arrays, O(n - k). index is accepted for parity with
+    # DoublyLinkedList.split_at; the copy counts the tail anyway
+    def split_at(self, slot, index=None):
+        other = CursorLinkedList()
+        prv = self.prev[slot]
+        if prv == NIL:
+            self.head = NIL
+        else:
+            self.next[prv] = NIL
+        self.tail = prv
+        while slot != NIL:
+            following = self.next[slot]
+            other.add_last(self.data[slot])
+            self._release(slot)
+            self.size -= 1
+            slot = following
+        return other
+
+    # Split off the elements from `index` on, walking to it from the closer end
+    def split_at_index(self, index):
+        try:
+            if index < 0 or index > self.size:
+                raise ValueError("Index out of bounds")
+            if index == self.size:
+                return CursorLinkedList()
+            if index < self.size / 2:
+                slot = self.head
+                for i in range(index):
+                    slot = self.next[slot]
+            else:
+                slot = self.tail
+                for i in range(self.size - 1, index, -1):
+                    slot = self.prev[slot]
+            return self.split_at(slot, index)
+        except ValueError as e:
+            print("Error:", e)
+
+    def peek_first(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.data[self.head]
+        except ValueError as e:
+            print("Error:", e)
+
+    def peek_last(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.data[self.tail]
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_first(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.remove(self.head)
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_last(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.remove(self.tail)
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove(self, slot):
+        nxt, prv = self.next[slot], self.prev[slot]
+        if prv == NIL:
+            self.head = nxt
+        else:
+            self.next[prv] = nxt
+        if nxt == NIL:
+            self.tail = prv
+        else:
+            self.prev[nxt] = prv
+        data = self.data[slot]
+        self._release(slot)
+        self.size -= 1
+        return data
+
+    def remove_at(self, index):
+        try:
+            if index < 0 or index >= self.size:
+                raise ValueError("Index out of bounds")
+            if index < self.size / 2:
+                slot = self.head
+                for i in range(index):
+                    slot = self.next[slot]
+            else:
+                slot = self.tail
+                for i in range(self.size - 1, index, -1):
+                    slot = self.prev[slot]
+            return self.remove(slot)
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_value(self, obj):
+        slot = self._find(obj)[0]
+        if slot == NIL:
+            return False
+        self.remove(slot)
+        return True
+
+    # (slot, index) of the first element equal to obj, (NIL, -1) if missing
+    def _find(self, obj):
+        index = 0
+        slot = self.head
+        data, next_ = self.data, self.next
+        while slot != NIL:
+            value = data[slot]
+            if (obj is None and value is None) or (obj is not None and obj == value):
+                return slot, index
+            slot = next_[slot]
+            index += 1
+        return NIL, -1
+
+    def index_of(self, obj):
+        return self._find(obj)[1]
+
+    def contains(self, obj):
+        return self.index_of(obj) != -1
+
+    def __iter__(self):
+        data, next_ = self.data, self.next
+        slot = self.head
+        while slot != NIL:
+            yield data[slot]
+            slot = next_[slot]
+
+    def __str__(self):
+        sb = "[ "
+        for data in self:
+            sb += str(data) + ", "
+        sb += " ]"
+        return sb
+
+
+# Example usage:
+if __name__ == "__main__":
+    cll = CursorLinkedList()
+    cll.add(3)
+    cll.add_first(2)
+    handle = cll.add_last(4)
+
+    print(cll)  # [ 2, 3, 4, ]
+    cll.move_to_front(handle)
+    print(cll)  # [ 4, 2, 3, ]
+    print(cll.remove(handle))  # 4
+    print(cll.remove_at(1))  # 3
+    print(cll.index_of(2))  # 0
+    print(cll.Size())  # 1
+
+    cll.splice(NIL, CursorLinkedList(7))  # Copies 7 in front
+    print(cll)  # [ 7, 2, ]
+    tail = cll.split_at_index(1)
+    print(cll, tail)  # [ 7, ] [ 2, ]
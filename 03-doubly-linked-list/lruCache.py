@@ -0,0 +1,105 @@
+# data structures - LRU cache
+# Dict of key -> DoublyLinkedList node, with the list ordered from most to
+# least recently used. A hit relinks the existing node at the front, so
+# get() is O(1) and allocates nothing. Eviction pops the tail.
+import sys
+
+from main import DoublyLinkedList
+
+
+class LRUCache:
+    # capacity: maximum number of entries
+    # max_bytes: optional limit on the total size of the cached values as
+    #            measured by `sizeof` (sys.getsizeof by default)
+    def __init__(self, capacity, max_bytes=None, sizeof=sys.getsizeof):
+        if capacity <= 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._nodes = {}  # key -> node, node.data is (key, value, nbytes)
+        self._order = DoublyLinkedList()
+
+    def size(self):
+        return len(self._nodes)
+
+    def is_empty(self):
+        return len(self._nodes) == 0
+
+    def contains(self, key):
+        return key in self._nodes
+
+    def get(self, key, default=None):
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.data[1]
+
+    def put(self, key, value):
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+        node = self._nodes.get(key)
+        if node is not None:
+            self.bytes -= node.data[2]
+            node.data = (key, value, nbytes)
+            self._order.move_to_front(node)
+        else:
+            self._nodes[key] = self._order.add_first((key, value, nbytes))
+        self.bytes += nbytes
+        # A value larger than max_bytes on its own ends up evicted as well
+        while len(self._nodes) > self.capacity or (
+                self.max_bytes is not None and self.bytes > self.max_bytes):
+            self._evict()
+
+    def remove(self, key):
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return False
+        self.bytes -= node.data[2]
+        self._order.remove(node)
+        return True
+
+    # Drop the least recently used entry
+    def _evict(self):
+        key, _, nbytes = self._order.remove_last()
+        del self._nodes[key]
+        self.bytes -= nbytes
+        self.evictions += 1
+
+    def clear(self):
+        self._nodes.clear()
+        self._order.clear()
+        self.bytes = 0
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    # Keys from most to least recently used
+    def __iter__(self):
+        for key, _, _ in self._order:
+            yield key
+
+
+# Example usage:
+if __name__ == "__main__":
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    print(cache.get("a"))  # 1
+    cache.put("c", 3)  # Evicts "b", the least recently used
+    print(cache.get("b"))  # None
+    print(list(cache))  # ['c', 'a']
+    print(cache.hits, cache.misses, cache.evictions)  # 1 1 1
+    print(cache.hit_rate())  # 0.5
+
+    sized = LRUCache(100, max_bytes=200, sizeof=len)
+    sized.put("x", "x" * 150)
+    sized.put("y", "y" * 100)  # 250 bytes > 200, evicts "x"
+    print(list(sized), sized.bytes)  # ['y'] 100
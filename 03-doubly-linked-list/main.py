@@ -27,8 +27,10 @@ class DoublyLinkedList:
     def Size(self):
         return self.size
 
+    # The add methods return the new node, callers can keep it as a handle
+    # for O(1) remove(node) / move_to_front(node) later on
     def add(self, elem):
-        self.add_last(elem)
+        return self.add_last(elem)
 
     def add_last(self, elem):
         if self.is_empty():
@@ -37,6 +39,7 @@ class DoublyLinkedList:
             self.tail.next = self.Node(elem, self.tail)
             self.tail = self.tail.next
         self.size += 1
+        return self.tail
 
     def add_first(self, elem):
         if self.is_empty():
@@ -45,6 +48,100 @@ class DoublyLinkedList:
             self.head.prev = self.Node(elem, None, self.head)
             self.head = self.head.prev
         self.size += 1
+        return self.head
+
+    # Relink an existing node at the front of the list, no allocation
+    def move_to_front(self, node):
+        if node is self.head:
+            return
+        node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = None
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+
+    # Move every node of `other` to the end of this list in O(1).
+    # `other` is left empty
+    def concat(self, other):
+        self.splice(self.tail, other)
+
+    # Move every node of `other` right after `node` (to the front when node
+    # is None) in O(1). `other` is left empty
+    def splice(self, node, other):
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other.is_empty():
+            return
+        first, last = other.head, other.tail
+        if node is None:
+            last.next = self.head
+            if self.head is None:
+                self.tail = last
+            else:
+                self.head.prev = last
+            self.head = first
+        else:
+            last.next = node.next
+            if node.next is None:
+                self.tail = last
+            else:
+                node.next.prev = last
+            node.next = first
+            first.prev = node
+        self.size += other.size
+        other.head = other.tail = None
+        other.size = 0
+
+    # Cut the list right before `node` and return node..tail as a new list.
+    # The relinking is O(1). Pass node's index when it is known so the sizes
+    # are O(1) too; otherwise both sides of the cut are walked in lockstep
+    # and the shorter one is counted, O(min(k, n - k))
+    def split_at(self, node, index=None):
+        if index is None:
+            forward, backward = node, node.prev
+            index = 0
+            while forward is not None and backward is not None:
+                forward, backward = forward.next, backward.prev
+                index += 1
+            if backward is None:
+                tail_size = None  # Stopped at the front: index is node's position
+            else:
+                tail_size = index  # Stopped at the back: index counts the tail
+                index = self.size - tail_size
+        other = DoublyLinkedList()
+        other.head, other.tail = node, self.tail
+        other.size = self.size - index
+        self.tail = node.prev
+        if self.tail is None:
+            self.head = None
+        else:
+            self.tail.next = None
+        node.prev = None
+        self.size = index
+        return other
+
+    # Split off the elements from `index` on, walking to it from the closer end
+    def split_at_index(self, index):
+        try:
+            if index < 0 or index > self.size:
+                raise ValueError("Index out of bounds")
+            if index == self.size:
+                return DoublyLinkedList()
+            if index < self.size / 2:
+                trav = self.head
+                for i in range(index):
+                    trav = trav.next
+            else:
+                trav = self.tail
+                for i in range(self.size - 1, index, -1):
+                    trav = trav.prev
+            return self.split_at(trav, index)
+        except ValueError as e:
+            print("Error:", e)
 
     def peek_first(self):
         try:
@@ -184,6 +281,18 @@ if __name__ == "__main__":
     print(dll)  # [ 3, 7, ]
 
     print(dll.index_of(7))  # 1
+    node = dll.add_last(8)
+    dll.move_to_front(node)
+    print(dll)  # [ 8, 3, 7, ]
+    dll.remove(node)
+
+    other = DoublyLinkedList()
+    other.add(10)
+    other.add(11)
+    dll.concat(other)
+    print(dll, other.Size())  # [ 3, 7, 10, 11, ] 0
+    rest = dll.split_at_index(2)
+    print(dll, rest)  # [ 3, 7, ] [ 10, 11, ]
     print(dll.contains(5))  # False
     for i in dll:
         print(i)  # Prints 3, 7
@@ -0,0 +1,252 @@
+# data structures - indexable skip list
+# A positional sequence (not a sorted set): elements keep the order they
+# were inserted in, like DoublyLinkedList. Every forward link also stores
+# its span, the number of positions it jumps over, so get / set /
+# insert_at / remove_at find a position in expected O(log n) instead of
+# walking the list.
+import random
+
+
+class IndexableSkipList:
+    # seed makes the tower heights (and so the timings) reproducible
+    def __init__(self, first_elem=None, seed=None, max_level=32, p=0.5):
+        self.max_level = max_level
+        self.p = p
+        self._rng = random.Random(seed)
+        self.head = self.Node(None, max_level)  # Sentinel at position -1
+        self.tail = None
+        self.level = 1  # Number of levels in use
+        self.size = 0
+        self._reset_head()
+        if first_elem is not None:
+            self.add_last(first_elem)
+
+    class Node:
+        __slots__ = ("data", "next", "span")
+
+        def __init__(self, data, level):
+            self.data = data
+            self.next = [None] * level
+            # span[l]: positions from this node to next[l], or to one past
+            # the last element when next[l] is None
+            self.span = [0] * level
+
+    def _reset_head(self):
+        head = self.head
+        for l in range(self.max_level):
+            head.next[l] = None
+            head.span[l] = 1
+
+    def _random_level(self):
+        level = 1
+        random_ = self._rng.random
+        while level < self.max_level and random_() < self.p:
+            level += 1
+        return level
+
+    # Predecessor of position `index` on every level and its position
+    def _find_update(self, index):
+        update = [None] * self.max_level
+        rank = [0] * self.max_level
+        node, pos = self.head, -1
+        for l in range(self.level - 1, -1, -1):
+            while node.next[l] is not None and pos + node.span[l] < index:
+                pos += node.span[l]
+                node = node.next[l]
+            update[l] = node
+            rank[l] = pos
+        return update, rank
+
+    # Node at position `index` (0 <= index < size)
+    def _node_at(self, index):
+        node, pos = self.head, -1
+        for l in range(self.level - 1, -1, -1):
+            while node.next[l] is not None and pos + node.span[l] <= index:
+                pos += node.span[l]
+                node = node.next[l]
+            if pos == index:
+                return node
+        return node
+
+    def clear(self):
+        self._reset_head()
+        self.tail = None
+        self.level = 1
+        self.size = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def Size(self):
+        return self.size
+
+    def get(self, index):
+        try:
+            if index < 0 or index >= self.size:
+                raise ValueError("Index out of bounds")
+            return self._node_at(index).data
+        except ValueError as e:
+            print("Error:", e)
+
+    def set(self, index, elem):
+        try:
+            if index < 0 or index >= self.size:
+                raise ValueError("Index out of bounds")
+            self._node_at(index).data = elem
+        except ValueError as e:
+            print("Error:", e)
+
+    def insert_at(self, index, elem):
+        try:
+            if index < 0 or index > self.size:
+                raise ValueError("Index out of bounds")
+            update, rank = self._find_update(index)
+            level = self._random_level()
+            if level > self.level:
+                for l in range(self.level, level):
+                    update[l] = self.head
+                    rank[l] = -1
+                    self.head.span[l] = self.size + 1
+                self.level = level
+            node = self.Node(elem, level)
+            for l in range(level):
+                pred = update[l]
+                node.next[l] = pred.next[l]
+                node.span[l] = pred.span[l] - (index - rank[l]) + 1
+                pred.next[l] = node
+                pred.span[l] = index - rank[l]
+            # Links above the new node's tower now jump over one more element
+            for l in range(level, self.level):
+                update[l].span[l] += 1
+            if node.next[0] is None:
+                self.tail = node
+            self.size += 1
+            return node
+        except ValueError as e:
+            print("Error:", e)
+
+    def add(self, elem):
+        return self.add_last(elem)
+
+    def add_last(self, elem):
+        return self.insert_at(self.size, elem)
+
+    def add_first(self, elem):
+        return self.insert_at(0, elem)
+
+    def peek_first(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.head.next[0].data
+        except ValueError as e:
+            print("Error:", e)
+
+    def peek_last(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.tail.data
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_at(self, index):
+        try:
+            if index < 0 or index >= self.size:
+                raise ValueError("Index out of bounds")
+            update, _ = self._find_update(index)
+            node = update[0].next[0]
+            for l in range(self.level):
+                pred = update[l]
+                if pred.next[l] is node:
+                    pred.span[l] += node.span[l] - 1
+                    pred.next[l] = node.next[l]
+                else:
+                    pred.span[l] -= 1
+            while self.level > 1 and self.head.next[self.level - 1] is None:
+                self.head.span[self.level - 1] = 1
+                self.level -= 1
+            if node is self.tail:
+                self.tail = None if update[0] is self.head else update[0]
+            self.size -= 1
+            data = node.data
+            node.data = None
+            return data
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_first(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.remove_at(0)
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_last(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.remove_at(self.size - 1)
+        except ValueError as e:
+            print("Error:", e)
+
+    # Nodes carry no back links, so finding the position of a node handle
+    # is a scan; the unlinking itself is O(log n)
+    def remove(self, node):
+        index = 0
+        trav = self.head.next[0]
+        while trav is not None:
+            if trav is node:
+                return self.remove_at(index)
+            trav = trav.next[0]
+            index += 1
+        return None
+
+    def remove_value(self, obj):
+        index = self.index_of(obj)
+        if index == -1:
+            return False
+        self.remove_at(index)
+        return True
+
+    def index_of(self, obj):
+        index = 0
+        trav = self.head.next[0]
+        while trav is not None:
+            if (obj is None and trav.data is None) or (obj is not None and obj == trav.data):
+                return index
+            trav = trav.next[0]
+            index += 1
+        return -1
+
+    def contains(self, obj):
+        return self.index_of(obj) != -1
+
+    def __iter__(self):
+        trav = self.head.next[0]
+        while trav:
+            yield trav.data
+            trav = trav.next[0]
+
+    def __str__(self):
+        sb = "[ "
+        for data in self:
+            sb += str(data) + ", "
+        sb += " ]"
+        return sb
+
+
+# Example usage:
+if __name__ == "__main__":
+    sl = IndexableSkipList(seed=42)
+    for i in range(10):
+        sl.add(i)
+
+    print(sl.get(7))  # 7
+    sl.insert_at(3, 42)
+    print(sl)  # [ 0, 1, 2, 42, 3, 4, 5, 6, 7, 8, 9,  ]
+    print(sl.remove_at(0))  # 0
+    print(sl.index_of(42))  # 2
+    print(sl.peek_first(), sl.peek_last())  # 1 9
+    print(sl.Size())  # 10
@@ -0,0 +1,260 @@
+# data structures - unrolled linked list
+# A doubly linked list whose nodes each hold up to `node_capacity` elements
+# in a small list. One node object per block instead of per element means
+# far fewer allocations, better locality and positional lookups that skip
+# a whole block per hop. Full nodes split in half, nodes that drop below
+# half full borrow from or merge with their successor.
+class UnrolledLinkedList:
+    def __init__(self, first_elem=None, node_capacity=64):
+        if node_capacity < 2:
+            raise ValueError(f"Illegal node capacity: {node_capacity}")
+        self.node_capacity = node_capacity
+        self.head = self.tail = None
+        self.size = 0
+        if first_elem is not None:
+            self.add_last(first_elem)
+
+    class Node:
+        __slots__ = ("items", "prev", "next")
+
+        def __init__(self, items, prev=None, next=None):
+            self.items = items
+            self.prev = prev
+            self.next = next
+
+    def clear(self):
+        trav = self.head
+        while trav is not None:
+            next_node = trav.next
+            trav.prev = trav.next = None
+            trav.items = None
+            trav = next_node
+        self.head = self.tail = trav = None
+        self.size = 0
+
+    def is_empty(self):
+        return self.size == 0
+
+    def Size(self):
+        return self.size
+
+    # Link a new node holding `items` after `node` (at the front if None)
+    def _link_after(self, node, items):
+        if node is None:
+            new_node = self.Node(items, None, self.head)
+            if self.head is not None:
+                self.head.prev = new_node
+            self.head = new_node
+        else:
+            new_node = self.Node(items, node, node.next)
+            if node.next is not None:
+                node.next.prev = new_node
+            node.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        return new_node
+
+    def _unlink(self, node):
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = node.items = None
+
+    # Node holding the element at `index` and the offset inside that node.
+    # Walks from whichever end is closer, one hop per block
+    def _locate(self, index):
+        if index < self.size / 2:
+            node = self.head
+            while index >= len(node.items):
+                index -= len(node.items)
+                node = node.next
+            return node, index
+        node = self.tail
+        index = self.size - index
+        while index > len(node.items):
+            index -= len(node.items)
+            node = node.prev
+        return node, len(node.items) - index
+
+    # Restore the half-full invariant after a removal from `node`
+    def _rebalance(self, node):
+        items = node.items
+        if not items:
+            self._unlink(node)
+            return
+        half = self.node_capacity // 2
+        following = node.next
+        if len(items) >= half or following is None:
+            return
+        if len(items) + len(following.items) <= self.node_capacity:
+            items.extend(following.items)
+            self._unlink(following)
+        else:
+            moved = (len(following.items) - len(items)) // 2
+            items.extend(following.items[:moved])
+            del following.items[:moved]
+
+    def add(self, elem):
+        self.add_last(elem)
+
+    def add_last(self, elem):
+        if self.tail is None or len(self.tail.items) >= self.node_capacity:
+            self._link_after(self.tail, [elem])
+        else:
+            self.tail.items.append(elem)
+        self.size += 1
+
+    def add_first(self, elem):
+        if self.head is None or len(self.head.items) >= self.node_capacity:
+            self._link_after(None, [elem])
+        else:
+            self.head.items.insert(0, elem)
+        self.size += 1
+
+    def insert_at(self, index, elem):
+        try:
+            if index < 0 or index > self.size:
+                raise ValueError("Index out of bounds")
+            if index == self.size:
+                return self.add_last(elem)
+            node, offset = self._locate(index)
+            if len(node.items) >= self.node_capacity:
+                # Split the full node, the upper half moves to a new node
+                half = len(node.items) // 2
+                self._link_after(node, node.items[half:])
+                del node.items[half:]
+                if offset > half:
+                    node, offset = node.next, offset - half
+            node.items.insert(offset, elem)
+            self.size += 1
+        except ValueError as e:
+            print("Error:", e)
+
+    def get(self, index):
+        try:
+            if index < 0 or index >= self.size:
+                raise ValueError("Index out of bounds")
+            node, offset = self._locate(index)
+            return node.items[offset]
+        except ValueError as e:
+            print("Error:", e)
+
+    def set(self, index, elem):
+        try:
+            if index < 0 or index >= self.size:
+                raise ValueError("Index out of bounds")
+            node, offset = self._locate(index)
+            node.items[offset] = elem
+        except ValueError as e:
+            print("Error:", e)
+
+    def peek_first(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.head.items[0]
+        except ValueError as e:
+            print("Error:", e)
+
+    def peek_last(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            return self.tail.items[-1]
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_first(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            node = self.head
+            data = node.items.pop(0)
+            self.size -= 1
+            self._rebalance(node)
+            return data
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_last(self):
+        try:
+            if self.is_empty():
+                raise ValueError("Empty list")
+            node = self.tail
+            data = node.items.pop()
+            self.size -= 1
+            if not node.items:
+                self._unlink(node)
+            return data
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_at(self, index):
+        try:
+            if index < 0 or index >= self.size:
+                raise ValueError("Index out of bounds")
+            node, offset = self._locate(index)
+            data = node.items.pop(offset)
+            self.size -= 1
+            self._rebalance(node)
+            return data
+        except ValueError as e:
+            print("Error:", e)
+
+    def remove_value(self, obj):
+        trav = self.head
+        while trav is not None:
+            if obj in trav.items:
+                trav.items.remove(obj)
+                self.size -= 1
+                self._rebalance(trav)
+                return True
+            trav = trav.next
+        return False
+
+    def index_of(self, obj):
+        index = 0
+        trav = self.head
+        while trav is not None:
+            if obj in trav.items:
+                return index + trav.items.index(obj)
+            index += len(trav.items)
+            trav = trav.next
+        return -1
+
+    def contains(self, obj):
+        return self.index_of(obj) != -1
+
+    def __iter__(self):
+        trav = self.head
+        while trav:
+            yield from trav.items
+            trav = trav.next
+
+    def __str__(self):
+        sb = "[ "
+        for data in self:
+            sb += str(data) + ", "
+        sb += " ]"
+        return sb
+
+
+# Example usage:
+if __name__ == "__main__":
+    ull = UnrolledLinkedList(node_capacity=4)
+    for i in range(10):
+        ull.add(i)
+    ull.add_first(-1)
+
+    print(ull)  # [ -1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9,  ]
+    print(ull.get(5))  # 4
+    print(ull.remove_at(5))  # 4
+    print(ull.index_of(7))  # 7
+    ull.insert_at(2, 42)
+    print(ull.peek_first(), ull.peek_last())  # -1 9
+    print(ull.Size())  # 11
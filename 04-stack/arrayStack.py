@@ -0,0 +1,59 @@
+# data structures - array-backed stack
+# Same API as Stack, but the elements sit in one Python list with the top
+# at the end: no node per push, and batches move with a single slice
+class ArrayStack:
+    def __init__(self, first_elem=None):
+        self._items = [first_elem] if first_elem is not None else []
+
+    def Size(self):
+        return len(self._items)
+
+    def is_empty(self):
+        return not self._items
+
+    def push(self, elem):
+        self._items.append(elem)
+
+    # Push every element of the iterable, the last one ends up on top
+    def push_many(self, iterable):
+        self._items.extend(iterable)
+
+    def pop(self):
+        if not self._items:
+            raise IndexError("Empty stack")
+        return self._items.pop()
+
+    # Pop k elements, returned in pop order (top of the stack first)
+    def pop_many(self, k):
+        if k < 0 or k > len(self._items):
+            raise IndexError("Not enough elements in the stack")
+        if k == 0:
+            return []
+        popped = self._items[-k:]
+        del self._items[-k:]
+        popped.reverse()
+        return popped
+
+    def peek(self):
+        if not self._items:
+            raise IndexError("Empty stack")
+        return self._items[-1]
+
+    # Top to bottom, like Stack
+    def __iter__(self):
+        return reversed(self._items)
+
+
+# Example usage:
+if __name__ == "__main__":
+    stack = ArrayStack()
+    stack.push(1)
+    stack.push_many([2, 3, 4])
+
+    print(stack.pop())  # 4
+    print(stack.peek())  # 3
+    print(stack.Size())  # 3
+    print(stack.pop_many(2))  # [3, 2]
+
+    for item in stack:
+        print(item)  # 1
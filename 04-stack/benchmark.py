@@ -0,0 +1,60 @@
+# Benchmarks for Stack, run with: python benchmark.py
+from timeit import timeit
+
+from arrayStack import ArrayStack
+from main import Stack
+
+
+# Producer/consumer churn: the stack hovers around `depth` elements while
+# every round pushes and pops `burst` items
+def churn(stack, rounds, depth=100, burst=50):
+    for i in range(depth):
+        stack.push(i)
+    for _ in range(rounds):
+        for i in range(burst):
+            stack.push(i)
+        for _ in range(burst):
+            stack.pop()
+
+
+def bench_pool(rounds=20000, burst=50):
+    pushes = rounds * burst
+    plain = Stack()
+    pooled = Stack(pool_size=1024)
+    t_plain = timeit(lambda: churn(plain, rounds, burst=burst), number=1)
+    t_pooled = timeit(lambda: churn(pooled, rounds, burst=burst), number=1)
+    pool = pooled.pool
+    print(f"{pushes} push/pop pairs at steady state")
+    print(f"{'':<12} {'nodes allocated':>16} {'seconds':>10}")
+    print(f"{'no pool':<12} {pushes + 100:>16} {t_plain:>10.4f}")
+    print(f"{'pool':<12} {pool.misses:>16} {t_pooled:>10.4f}"
+          f"   hit rate {pool.hit_rate():.2%}")
+
+
+# DFS-style traffic: push a batch, pop it back, n items in total
+def bench_array_stack(n=1000000, batch=64):
+    items = list(range(batch))
+    rounds = n // batch
+
+    def single(stack):
+        push, pop = stack.push, stack.pop
+        for _ in range(rounds):
+            for item in items:
+                push(item)
+            for _ in items:
+                pop()
+
+    def bulk(stack):
+        for _ in range(rounds):
+            stack.push_many(items)
+            stack.pop_many(batch)
+
+    print(f"{rounds * batch} pushes and pops in batches of {batch} (s)")
+    print(f"{'Stack push/pop':<24} {timeit(lambda: single(Stack()), number=1):>10.4f}")
+    print(f"{'ArrayStack push/pop':<24} {timeit(lambda: single(ArrayStack()), number=1):>10.4f}")
+    print(f"{'ArrayStack *_many':<24} {timeit(lambda: bulk(ArrayStack()), number=1):>10.4f}")
+
+
+if __name__ == "__main__":
+    bench_pool()
+    bench_array_stack()
@@ -0,0 +1,82 @@
+# data structures - blocking stack
+# Thread-safe wrapper around Stack for worker pools. One lock guards the
+# stack, two condition variables on that lock let pop() sleep until an
+# element arrives and push() sleep until there is room (when a capacity
+# is set), instead of polling with sleeps.
+import threading
+
+from main import Stack
+
+
+class BlockingStack:
+    # capacity=None means unbounded, push() then never blocks
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        self.capacity = capacity
+        self._stack = Stack()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def Size(self):
+        with self._lock:
+            return self._stack.Size()
+
+    def is_empty(self):
+        with self._lock:
+            return self._stack.is_empty()
+
+    def _has_room(self):
+        return self.capacity is None or self._stack.Size() < self.capacity
+
+    # Push an element, waiting up to `timeout` seconds (forever when None)
+    # for room. Raises TimeoutError when the stack stays full
+    def push(self, elem, timeout=None):
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_room, timeout):
+                raise TimeoutError("Stack is full")
+            self._stack.push(elem)
+            self._not_empty.notify()
+
+    # Pop the top element, waiting up to `timeout` seconds (forever when
+    # None) for one to arrive. Raises TimeoutError when still empty
+    def pop(self, timeout=None):
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._stack.Size, timeout):
+                raise TimeoutError("Empty stack")
+            data = self._stack.pop()
+            self._not_full.notify()
+            return data
+
+    def peek(self):
+        with self._lock:
+            return self._stack.peek()
+
+    # Pop up to max_items elements (all when None), top first, under a
+    # single lock acquisition. Never blocks
+    def drain(self, max_items=None):
+        with self._lock:
+            count = self._stack.Size()
+            if max_items is not None:
+                count = min(count, max_items)
+            items = [self._stack.pop() for _ in range(count)]
+            if count:
+                self._not_full.notify(count)
+            return items
+
+
+# Example usage:
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    stack = BlockingStack(capacity=2)
+
+    with ThreadPoolExecutor() as pool:
+        pool.submit(lambda: [stack.push(i) for i in range(5)])
+        received = sorted(stack.pop(timeout=1) for _ in range(5))
+    print(received)  # [0, 1, 2, 3, 4]
+
+    stack.push(1)
+    stack.push(2)
+    print(stack.drain())  # [2, 1]
@@ -1,7 +1,39 @@
 
 
+# Bounded free list of recycled nodes. Popped / removed nodes are kept
+# (up to max_size) and handed out again instead of allocating new ones
+class NodePool:
+    def __init__(self, node_class, max_size=1024):
+        self.node_class = node_class
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0  # Nodes served from the free list
+        self.misses = 0  # Nodes that had to be allocated
+
+    def acquire(self, data):
+        if self.free:
+            self.hits += 1
+            node = self.free.pop()
+            node.data = data
+            return node
+        self.misses += 1
+        return self.node_class(data)
+
+    def release(self, node):
+        node.data = None  # Don't keep the element alive
+        node.next = None
+        if len(self.free) < self.max_size:
+            self.free.append(node)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
 class Stack:
-    def __init__(self, first_elem=None):
+    # pool_size > 0 recycles popped nodes through a NodePool of that size
+    def __init__(self, first_elem=None, pool_size=0):
+        self.pool = NodePool(self.Node, pool_size) if pool_size > 0 else None
         self.head = self.Node(
             first_elem) if first_elem is not None else first_elem
         self._size = 1 if first_elem is not None else 0
@@ -18,7 +50,7 @@ class Stack:
         return self._size == 0
 
     def push(self, elem):
-        new_node = self.Node(elem)
+        new_node = self.pool.acquire(elem) if self.pool else self.Node(elem)
         new_node.next = self.head
         self.head = new_node
         self._size += 1
@@ -29,7 +61,10 @@ class Stack:
         popped_node = self.head
         self.head = self.head.next
         self._size -= 1
-        return popped_node.data
+        data = popped_node.data
+        if self.pool:
+            self.pool.release(popped_node)
+        return data
 
     def peek(self):
         if self.is_empty():
@@ -44,14 +79,21 @@ class Stack:
 
 
 # Example usage:
-stack = Stack()
-stack.push(1)
-stack.push(2)
-stack.push(3)
+if __name__ == "__main__":
+    stack = Stack()
+    stack.push(1)
+    stack.push(2)
+    stack.push(3)
+
+    print(stack.pop())  # 3
+    print(stack.peek())  # 2
+    print(stack.Size())  # 2
 
-print(stack.pop())  # 3
-print(stack.peek())  # 2
-print(stack.Size())  # 2
+    for item in stack:
+        print(item)  # 2, 1
 
-for item in stack:
-    print(item)  # 2, 1
+    pooled = Stack(pool_size=64)
+    for _ in range(3):
+        pooled.push(1)
+        pooled.pop()
+    print(pooled.pool.hits, pooled.pool.misses)  # 2 1
@@ -0,0 +1,149 @@
+# data structures - array-backed integer stack
+# Same API as IntegerStack, but the elements are stored unboxed in an
+# array('q') with the top at the end. Batches are type checked once (by
+# the array conversion) and moved with a single slice
+from array import array
+from bisect import bisect_left
+
+
+class ArrayIntegerStack:
+    # track_extrema=True makes get_min() / get_max() O(1), see IntegerStack.
+    # The side stacks are array('q') columns too, 16 bytes per record
+    def __init__(self, first_elem=None, track_extrema=False):
+        if first_elem is not None and not isinstance(first_elem, int):
+            raise TypeError("Only integers are allowed")
+        self._items = array("q")
+        self.track_extrema = track_extrema
+        self._min_depth, self._min_value = array("q"), array("q")
+        self._max_depth, self._max_value = array("q"), array("q")
+        if first_elem is not None:
+            self.push(first_elem)
+
+    def size(self):
+        return len(self._items)
+
+    def is_empty(self):
+        return len(self._items) == 0
+
+    # Record every value of `batch` that sets a new extreme, the first one
+    # being pushed at depth `depth`
+    def _track_push(self, batch, depth):
+        min_depth, min_value = self._min_depth, self._min_value
+        max_depth, max_value = self._max_depth, self._max_value
+        low = min_value[-1] if min_value else None
+        high = max_value[-1] if max_value else None
+        for elem in batch:
+            if low is None or elem < low:
+                low = elem
+                min_depth.append(depth)
+                min_value.append(elem)
+            if high is None or elem > high:
+                high = elem
+                max_depth.append(depth)
+                max_value.append(elem)
+            depth += 1
+
+    # Forget the records made at depth >= size. Depths are increasing, so a
+    # bisect finds the cut and one slice drops it
+    def _track_pop(self, size):
+        cut = bisect_left(self._min_depth, size)
+        del self._min_depth[cut:]
+        del self._min_value[cut:]
+        cut = bisect_left(self._max_depth, size)
+        del self._max_depth[cut:]
+        del self._max_value[cut:]
+
+    def push(self, elem):
+        if not isinstance(elem, int):
+            raise TypeError("Only integers are allowed")
+        # Store first: a value out of int64 range raises OverflowError here,
+        # before the side stacks record it
+        self._items.append(elem)
+        if self.track_extrema:
+            self._track_push((elem,), len(self._items) - 1)
+
+    # Push every element of the iterable, the last one ends up on top.
+    # Nothing is pushed if any element is not an integer
+    def push_many(self, iterable):
+        if isinstance(iterable, (bytes, bytearray)):
+            # array() would read these as raw memory, push the byte values
+            iterable = list(iterable)
+        try:
+            batch = array("q", iterable)
+        except TypeError:
+            raise TypeError("Only integers are allowed") from None
+        if self.track_extrema:
+            self._track_push(batch, len(self._items))
+        self._items.extend(batch)
+
+    def pop(self):
+        if len(self._items) == 0:
+            raise IndexError("Empty stack")
+        elem = self._items.pop()
+        if self.track_extrema:
+            self._track_pop(len(self._items))
+        return elem
+
+    # Pop k elements, returned as an array('q') in pop order (top first)
+    def pop_many(self, k):
+        if k < 0 or k > len(self._items):
+            raise IndexError("Not enough elements in the stack")
+        if k == 0:
+            return array("q")
+        popped = self._items[-k:]
+        del self._items[-k:]
+        if self.track_extrema:
+            self._track_pop(len(self._items))
+        popped.reverse()
+        return popped
+
+    def peek(self):
+        if len(self._items) == 0:
+            raise IndexError("Empty stack")
+        return self._items[-1]
+
+    def get_min(self):
+        if len(self._items) == 0:
+            raise IndexError("Empty stack")
+        if self.track_extrema:
+            return self._min_value[-1]
+        return min(self._items)
+
+    def get_max(self):
+        if len(self._items) == 0:
+            raise IndexError("Empty stack")
+        if self.track_extrema:
+            return self._max_value[-1]
+        return max(self._items)
+
+    # Top to bottom, like IntegerStack
+    def __iter__(self):
+        return reversed(self._items)
+
+
+# Example usage:
+if __name__ == "__main__":
+    stack = ArrayIntegerStack()
+    stack.push(1)
+    stack.push_many(range(2, 5))
+
+    print(stack.pop())  # 4
+    print(stack.peek())  # 3
+    print(stack.size())  # 3
+    print(stack.pop_many(2).tolist())  # [3, 2]
+
+    for item in stack:
+        print(item)  # 1
+
+    # A failed push leaves the stack and its extrema as they were
+    tracked = ArrayIntegerStack(1, track_extrema=True)
+    try:
+        tracked.push(2**70)
+    except OverflowError as e:
+        print("Error:", e)  # Error: int too big to convert
+    tracked.push_many([5, 7])
+    tracked.pop()
+    print(tracked.get_max())  # 5
+
+    # The following will throw an error
+    # stack.push_many([5, "hello"])  # TypeError: Only integers are allowed
@@ -0,0 +1,71 @@
+# Benchmarks for IntegerStack min/max tracking, run with: python benchmark.py
+import random
+import tracemalloc
+from timeit import timeit
+
+from arrayIntegerStack import ArrayIntegerStack
+from main import IntegerStack
+
+
+# Monitoring loop: push a sample, read the current min and max
+def monitor(stack, samples):
+    for sample in samples:
+        stack.push(sample)
+        stack.get_min()
+        stack.get_max()
+
+
+def bench_queries(depths=(100, 1000, 10000), samples=2000):
+    rng = random.Random(1)
+    print(f"{samples} push + get_min + get_max at a given stack depth (s)")
+    print(f"{'depth':>8} {'scan':>10} {'tracked':>10}")
+    for depth in depths:
+        base = [rng.randrange(1 << 30) for _ in range(depth)]
+        data = [rng.randrange(1 << 30) for _ in range(samples)]
+        scan = IntegerStack()
+        tracked = IntegerStack(track_extrema=True)
+        scan.push_many(base)
+        tracked.push_many(base)
+        t_scan = timeit(lambda: monitor(scan, data), number=1)
+        t_tracked = timeit(lambda: monitor(tracked, data), number=1)
+        print(f"{depth:>8} {t_scan:>10.4f} {t_tracked:>10.4f}")
+
+
+def extra_bytes(cls, values, **kwargs):
+    def build(track):
+        stack = cls(track_extrema=track, **kwargs)
+        stack.push_many(values)
+        return stack
+
+    tracemalloc.start()
+    plain = build(False)
+    plain_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del plain
+    tracemalloc.start()
+    tracked = build(True)
+    tracked_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tracked
+    return (tracked_size - plain_size) / len(values)
+
+
+# The side stacks only hold record-setting pushes: almost nothing for
+# random data, one entry per push for sorted data
+def bench_memory(n=100000):
+    rng = random.Random(1)
+    inputs = {
+        "random": [rng.randrange(1 << 30) for _ in range(n)],
+        "ascending": list(range(n)),
+        "descending": list(range(n, 0, -1)),
+    }
+    print(f"extra bytes per element for tracking, n = {n}")
+    print(f"{'input':<12} {'IntegerStack':>14} {'ArrayIntStack':>14}")
+    for name, values in inputs.items():
+        print(f"{name:<12} {extra_bytes(IntegerStack, values):>14.2f}"
+              f" {extra_bytes(ArrayIntegerStack, values):>14.2f}")
+
+
+if __name__ == "__main__":
+    bench_queries()
+    bench_memory()
@@ -1,12 +1,54 @@
 
 
+# Bounded free list of recycled nodes. Popped / removed nodes are kept
+# (up to max_size) and handed out again instead of allocating new ones
+class NodePool:
+    def __init__(self, node_class, max_size=1024):
+        self.node_class = node_class
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0  # Nodes served from the free list
+        self.misses = 0  # Nodes that had to be allocated
+
+    def acquire(self, data):
+        if self.free:
+            self.hits += 1
+            node = self.free.pop()
+            node.data = data
+            return node
+        self.misses += 1
+        return self.node_class(data)
+
+    def release(self, node):
+        node.data = None  # Don't keep the element alive
+        node.next = None
+        if len(self.free) < self.max_size:
+            self.free.append(node)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
 class IntegerStack:
-    def __init__(self, first_elem=None):
+    # pool_size > 0 recycles popped nodes through a NodePool of that size
+    # track_extrema=True makes get_min() / get_max() O(1). Two side stacks
+    # record (depth, value) every time a push sets a new minimum / maximum
+    # and drop the entry when that depth is popped. They hold one entry per
+    # record-setting push: a handful for random data, about n for sorted
+    # input (benchmark.py measures ~48 extra bytes per element then)
+    def __init__(self, first_elem=None, pool_size=0, track_extrema=False):
         if first_elem is not None and not isinstance(first_elem, int):
             raise TypeError("Only integers are allowed")
+        self.pool = NodePool(self.Node, pool_size) if pool_size > 0 else None
+        self.track_extrema = track_extrema
+        self._min_depth, self._min_value = [], []
+        self._max_depth, self._max_value = [], []
         self.head = self.Node(
             first_elem) if first_elem is not None else first_elem
         self._size = 1 if first_elem is not None else 0
+        if first_elem is not None and track_extrema:
+            self._track_push(first_elem, 0)
 
     class Node:
         def __init__(self, data=None):
@@ -19,21 +61,95 @@ class IntegerStack:
     def is_empty(self):
         return self._size == 0
 
+    # Record elem (pushed at the given depth) if it is a new extreme
+    def _track_push(self, elem, depth):
+        if not self._min_value or elem < self._min_value[-1]:
+            self._min_depth.append(depth)
+            self._min_value.append(elem)
+        if not self._max_value or elem > self._max_value[-1]:
+            self._max_depth.append(depth)
+            self._max_value.append(elem)
+
+    # Forget the records made at depth >= size
+    def _track_pop(self, size):
+        while self._min_depth and self._min_depth[-1] >= size:
+            self._min_depth.pop()
+            self._min_value.pop()
+        while self._max_depth and self._max_depth[-1] >= size:
+            self._max_depth.pop()
+            self._max_value.pop()
+
     def push(self, elem):
         if not isinstance(elem, int):
             raise TypeError("Only integers are allowed")
-        new_node = self.Node(elem)
+        if self.track_extrema:
+            self._track_push(elem, self._size)
+        new_node = self.pool.acquire(elem) if self.pool else self.Node(elem)
         new_node.next = self.head
         self.head = new_node
         self._size += 1
 
+    # Push every element of the iterable, the last one ends up on top.
+    # The batch is type checked once up front, nothing is pushed on error
+    def push_many(self, iterable):
+        batch = list(iterable)
+        if not all(isinstance(elem, int) for elem in batch):
+            raise TypeError("Only integers are allowed")
+        make_node = self.pool.acquire if self.pool else self.Node
+        head, depth = self.head, self._size
+        for elem in batch:
+            if self.track_extrema:
+                self._track_push(elem, depth)
+            node = make_node(elem)
+            node.next = head
+            head = node
+            depth += 1
+        self.head, self._size = head, depth
+
     def pop(self):
         if self.is_empty():
             raise IndexError("Empty stack")
         popped_node = self.head
         self.head = self.head.next
         self._size -= 1
-        return popped_node.data
+        if self.track_extrema:
+            self._track_pop(self._size)
+        data = popped_node.data
+        if self.pool:
+            self.pool.release(popped_node)
+        return data
+
+    # Pop k elements, returned in pop order (top of the stack first)
+    def pop_many(self, k):
+        if k < 0 or k > self._size:
+            raise IndexError("Not enough elements in the stack")
+        popped = []
+        node = self.head
+        for _ in range(k):
+            popped.append(node.data)
+            following = node.next
+            if self.pool:
+                self.pool.release(node)
+            node = following
+        self.head = node
+        self._size -= k
+        if self.track_extrema:
+            self._track_pop(self._size)
+        return popped
+
+    def get_min(self):
+        if self.is_empty():
+            raise IndexError("Empty stack")
+        if self.track_extrema:
+            return self._min_value[-1]
+        return min(self)
+
+    def get_max(self):
+        if self.is_empty():
+            raise IndexError("Empty stack")
+        if self.track_extrema:
+            return self._max_value[-1]
+        return max(self)
 
     def peek(self):
         if self.is_empty():
@@ -48,17 +164,24 @@ class IntegerStack:
 
 
 # Example usage:
-stack = IntegerStack()
-stack.push(1)
-stack.push(2)
-stack.push(3)
+if __name__ == "__main__":
+    stack = IntegerStack()
+    stack.push(1)
+    stack.push(2)
+    stack.push(3)
+
+    print(stack.pop())  # 3
+    print(stack.peek())  # 2
+    print(stack.size())  # 2
 
-print(stack.pop())  # 3
-print(stack.peek())  # 2
-print(stack.size())  # 2
+    for item in stack:
+        print(item)  # 2, 1
 
-for item in stack:
-    print(item)  # 2, 1
+    tracked = IntegerStack(track_extrema=True)
+    tracked.push_many([5, 2, 8, 1])
+    print(tracked.get_min(), tracked.get_max())  # 1 8
+    tracked.pop_many(2)
+    print(tracked.get_min(), tracked.get_max())  # 2 5
 
-# The following will throw an error
-# stack.push("hello")  # TypeError: Only integers are allowed
+    # The following will throw an error
+    # stack.push("hello")  # TypeError: Only integers are allowed
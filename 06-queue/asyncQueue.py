@@ -0,0 +1,154 @@
+# data structures - asyncio queue
+# Coroutine-friendly wrapper around Queue (or RingQueue) for asyncio
+# producer / consumer tasks. Waiting tasks park on futures that are
+# resolved by the opposite operation, so nothing polls is_empty(). An
+# element only leaves the backing queue in the same step that hands it to
+# the caller, so cancelling a waiting get() / get_batch() never loses an
+# element and cancelling a waiting put() never adds one. Like asyncio
+# itself it is meant for one event loop and is not thread-safe.
+import asyncio
+from collections import deque
+
+from main import Queue
+
+
+class AsyncQueue:
+    # capacity=None means unbounded, put() then never waits. queue is the
+    # backing store, anything with offer / poll / size (a new Queue by
+    # default); its poll_many is used for batches when it has one
+    def __init__(self, capacity=None, queue=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        self.capacity = capacity
+        self._queue = Queue() if queue is None else queue
+        self._getters = deque()  # get() / get_batch() waiting for an element
+        self._putters = deque()  # put() waiting for room
+        self._lingerers = []  # get_batch() waiting for its batch to fill
+
+    def size(self):
+        return self._queue.size()
+
+    def is_empty(self):
+        return self._queue.size() == 0
+
+    def is_full(self):
+        return self.capacity is not None and self._queue.size() >= self.capacity
+
+    # Resolve the first waiter that is still pending
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    # Park on a new future in waiters. If the task is cancelled after it
+    # was already woken, the wakeup is passed on when `ready` still holds
+    @classmethod
+    async def _park(cls, waiters, ready):
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            if not waiter.cancelled() and ready():
+                cls._wakeup_next(waiters)
+            raise
+
+    # Remove k elements (k <= size) and let up to k waiting put() go on
+    def _take(self, k):
+        poll_many = getattr(self._queue, "poll_many", None)
+        if poll_many is not None:
+            items = poll_many(k)
+        else:
+            items = [self._queue.poll() for _ in range(k)]
+        putters = self._putters
+        while k and putters:
+            self._wakeup_next(putters)
+            k -= 1
+        return items
+
+    # Add an element to the back of the queue, waiting while it is full
+    async def put(self, elem):
+        while self.is_full():
+            await self._park(self._putters, lambda: not self.is_full())
+        self._queue.offer(elem)
+        if self._getters:
+            self._wakeup_next(self._getters)
+        if self._lingerers:
+            for lingerer in self._lingerers:
+                if not lingerer.done():
+                    lingerer.set_result(None)
+            self._lingerers.clear()
+
+    # Remove and return the front element, waiting until there is one
+    async def get(self):
+        while self.is_empty():
+            await self._park(self._getters, lambda: not self.is_empty())
+        data = self._queue.poll()
+        if self._putters:
+            self._wakeup_next(self._putters)
+        return data
+
+    # Micro-batching get: wait for the first element, then give the batch
+    # up to max_wait seconds to fill to max_items before returning it.
+    # Always returns at least one element, in queue order
+    async def get_batch(self, max_items, max_wait):
+        if max_items <= 0:
+            raise ValueError(f"Illegal batch size: {max_items}")
+        loop = asyncio.get_running_loop()
+        while True:
+            while self.is_empty():
+                await self._park(self._getters, lambda: not self.is_empty())
+            deadline = loop.time() + max_wait
+            try:
+                # A full queue can't grow, stop lingering once it is
+                while 0 < self.size() < max_items and not self.is_full():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    lingerer = loop.create_future()
+                    self._lingerers.append(lingerer)
+                    try:
+                        await asyncio.wait((lingerer,), timeout=remaining)
+                    finally:
+                        if not lingerer.done():
+                            lingerer.cancel()
+                            self._lingerers.remove(lingerer)
+            except BaseException:
+                # The elements stay queued; don't leave other getters asleep
+                if not self.is_empty():
+                    self._wakeup_next(self._getters)
+                raise
+            # Other consumers may have emptied the queue while we lingered
+            if not self.is_empty():
+                return self._take(min(max_items, self.size()))
+
+
+# Example usage
+if __name__ == "__main__":
+    async def main():
+        queue = AsyncQueue(capacity=4)
+
+        async def produce(n):
+            for i in range(n):
+                await queue.put(i)  # Waits while 4 items are queued
+
+        producer = asyncio.create_task(produce(10))
+        print([await queue.get() for _ in range(3)])  # Output: [0, 1, 2]
+        print(await queue.get_batch(8, max_wait=0.01))  # Output: [3, 4, 5, 6]
+        await producer
+        print(queue.size())  # Output: 3
+
+        consumer = asyncio.create_task(queue.get_batch(10, max_wait=1))
+        await asyncio.sleep(0)
+        consumer.cancel()  # Nothing is lost, the elements are still queued
+        print(await queue.get_batch(10, max_wait=0))  # Output: [7, 8, 9]
+
+    asyncio.run(main())
@@ -0,0 +1,154 @@
+# Benchmarks for Queue, run with: python benchmark.py
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from timeit import timeit
+
+from asyncQueue import AsyncQueue
+from blockingQueue import BlockingQueue
+from main import Queue
+from ringQueue import RingQueue
+
+
+# Producer/consumer churn: the queue hovers around `depth` elements while
+# every round offers and polls `burst` items
+def churn(queue, rounds, depth=100, burst=50):
+    for i in range(depth):
+        queue.offer(i)
+    for _ in range(rounds):
+        for i in range(burst):
+            queue.offer(i)
+        for _ in range(burst):
+            queue.poll()
+
+
+def bench_pool(rounds=20000, burst=50):
+    offers = rounds * burst
+    plain = Queue()
+    pooled = Queue(pool_size=1024)
+    t_plain = timeit(lambda: churn(plain, rounds, burst=burst), number=1)
+    t_pooled = timeit(lambda: churn(pooled, rounds, burst=burst), number=1)
+    pool = pooled.pool
+    print(f"{offers} offer/poll pairs at steady state")
+    print(f"{'':<12} {'nodes allocated':>16} {'seconds':>10}")
+    print(f"{'no pool':<12} {offers + 100:>16} {t_plain:>10.4f}")
+    print(f"{'pool':<12} {pool.misses:>16} {t_pooled:>10.4f}"
+          f"   hit rate {pool.hit_rate():.2%}")
+
+
+_DONE = object()
+
+
+def _consume(queue, batch):
+    count = 0
+    while True:
+        items = [queue.poll()]
+        if batch > 1:
+            items += queue.drain(batch - 1)
+        done = sum(1 for item in items if item is _DONE)
+        if done:
+            # Hand the extra stop markers back to the other consumers
+            for _ in range(done - 1):
+                queue.offer(_DONE)
+            return count + len(items) - done
+        count += len(items)
+
+
+# `threads` producers and `threads` consumers on one bounded BlockingQueue.
+# Consumers either poll() one item at a time or poll() once and drain()
+# the rest of a batch under the same single lock acquisition
+def contention(threads, items, batch):
+    queue = BlockingQueue(capacity=1024)
+    per_producer = items // threads
+    with ThreadPoolExecutor(max_workers=2 * threads) as pool:
+        consumers = [pool.submit(_consume, queue, batch) for _ in range(threads)]
+        producers = [pool.submit(lambda: [queue.offer(i) for i in range(per_producer)])
+                     for _ in range(threads)]
+        for producer in producers:
+            producer.result()
+        for _ in range(threads):
+            queue.offer(_DONE)
+        assert sum(consumer.result() for consumer in consumers) == per_producer * threads
+
+
+def bench_contention(items=200000):
+    print(f"{items} items through a BlockingQueue, N producers + N consumers (s)")
+    print(f"{'N':>4} {'poll':>10} {'drain(64)':>10}")
+    for threads in (1, 2, 4, 8):
+        single = timeit(lambda: contention(threads, items, 1), number=1)
+        batched = timeit(lambda: contention(threads, items, 64), number=1)
+        print(f"{threads:>4} {single:>10.4f} {batched:>10.4f}")
+
+
+def bench_ring_queue(rounds=20000, burst=50):
+    items = list(range(burst))
+
+    def single(offer, poll):
+        for _ in range(rounds):
+            for item in items:
+                offer(item)
+            for _ in items:
+                poll()
+
+    def ring_bulk():
+        queue = RingQueue()
+        for _ in range(rounds):
+            queue.offer_many(items)
+            queue.poll_many(burst)
+
+    linked, ring, dq = Queue(), RingQueue(), deque()
+    print(f"{rounds * burst} offer/poll pairs in bursts of {burst} (s)")
+    print(f"{'Queue (linked)':<24} {timeit(lambda: single(linked.offer, linked.poll), number=1):>10.4f}")
+    print(f"{'RingQueue':<24} {timeit(lambda: single(ring.offer, ring.poll), number=1):>10.4f}")
+    print(f"{'RingQueue *_many':<24} {timeit(ring_bulk, number=1):>10.4f}")
+    print(f"{'collections.deque':<24} {timeit(lambda: single(dq.append, dq.popleft), number=1):>10.4f}")
+
+
+async def _async_consume(queue, batch):
+    count = 0
+    while True:
+        items = [await queue.get()] if batch == 1 else await queue.get_batch(batch, 0)
+        done = sum(1 for item in items if item is _DONE)
+        if done:
+            for _ in range(done - 1):
+                await queue.put(_DONE)
+            return count + len(items) - done
+        count += len(items)
+
+
+# `tasks` producer and `tasks` consumer coroutines on one bounded queue.
+# asyncio.Queue has no batch get, so it only runs the get() column
+async def async_throughput(queue, tasks, items, batch):
+    per_producer = items // tasks
+
+    async def produce():
+        for i in range(per_producer):
+            await queue.put(i)
+
+    consumers = [asyncio.create_task(_async_consume(queue, batch)) for _ in range(tasks)]
+    await asyncio.gather(*(produce() for _ in range(tasks)))
+    for _ in range(tasks):
+        await queue.put(_DONE)
+    assert sum(await asyncio.gather(*consumers)) == per_producer * tasks
+
+
+def bench_async(items=200000, capacity=1024):
+    def run(make_queue, tasks, batch):
+        return timeit(lambda: asyncio.run(async_throughput(make_queue(), tasks, items, batch)),
+                      number=1)
+
+    print(f"{items} items through an asyncio queue, N producers + N consumers (s)")
+    print(f"{'N':>4} {'asyncio.Queue':>14} {'AsyncQueue':>11} {'get_batch(64)':>14}"
+          f" {'Ring+batch':>11}")
+    for tasks in (1, 10, 100):
+        print(f"{tasks:>4} {run(lambda: asyncio.Queue(capacity), tasks, 1):>14.4f}"
+              f" {run(lambda: AsyncQueue(capacity), tasks, 1):>11.4f}"
+              f" {run(lambda: AsyncQueue(capacity), tasks, 64):>14.4f}"
+              f" {run(lambda: AsyncQueue(capacity, RingQueue()), tasks, 64):>11.4f}")
+
+
+if __name__ == "__main__":
+    bench_pool()
+    bench_contention()
+    bench_ring_queue()
+    bench_async()
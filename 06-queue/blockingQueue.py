@@ -0,0 +1,92 @@
+# data structures - blocking queue
+# Thread-safe wrapper around Queue for producer / consumer pools. One lock
+# guards the queue, two condition variables on that lock let consumers
+# sleep until an element arrives and producers sleep until there is room
+# (when a capacity is set), instead of polling with sleeps.
+import threading
+
+from main import Queue
+
+
+class BlockingQueue:
+    # capacity=None means unbounded, offer() then never blocks
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        self.capacity = capacity
+        self._queue = Queue()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def size(self):
+        with self._lock:
+            return self._queue.size()
+
+    def is_empty(self):
+        with self._lock:
+            return self._queue.is_empty()
+
+    def _has_room(self):
+        return self.capacity is None or self._queue.size() < self.capacity
+
+    # Add an element to the back of the queue, waiting up to `timeout`
+    # seconds (forever when None) for room. Raises TimeoutError when full
+    def offer(self, elem, timeout=None):
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_room, timeout):
+                raise TimeoutError("Queue is full")
+            self._queue.offer(elem)
+            self._not_empty.notify()
+
+    # Remove the front element, waiting up to `timeout` seconds (forever
+    # when None) for one to arrive. Raises TimeoutError when still empty
+    def poll(self, timeout=None):
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._queue.size, timeout):
+                raise TimeoutError("Queue is empty")
+            data = self._queue.poll()
+            self._not_full.notify()
+            return data
+
+    def peek(self):
+        with self._lock:
+            if self._queue.is_empty():
+                raise IndexError("Queue is empty")
+            return self._queue.peek()
+
+    # Remove up to max_items elements (all when None) that are already in
+    # the queue, under a single lock acquisition. Never blocks
+    def drain(self, max_items=None):
+        with self._lock:
+            count = self._queue.size()
+            if max_items is not None:
+                count = min(count, max_items)
+            items = [self._queue.poll() for _ in range(count)]
+            if count:
+                self._not_full.notify(count)
+            return items
+
+
+# Example usage
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    queue = BlockingQueue(capacity=4)
+
+    def produce(n):
+        for i in range(n):
+            queue.offer(i)  # Blocks while 4 items are waiting
+
+    with ThreadPoolExecutor() as pool:
+        pool.submit(produce, 10)
+        received = [queue.poll(timeout=1) for _ in range(10)]
+    print(received)  # Output: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    queue.offer("a")
+    queue.offer("b")
+    print(queue.drain())  # Output: ['a', 'b']
+    try:
+        queue.poll(timeout=0.01)
+    except TimeoutError as e:
+        print("Error:", e)  # Output: Error: Queue is empty
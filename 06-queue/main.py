@@ -1,5 +1,37 @@
+# Bounded free list of recycled nodes. Popped / removed nodes are kept
+# (up to max_size) and handed out again instead of allocating new ones
+class NodePool:
+    def __init__(self, node_class, max_size=1024):
+        self.node_class = node_class
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0  # Nodes served from the free list
+        self.misses = 0  # Nodes that had to be allocated
+
+    def acquire(self, data):
+        if self.free:
+            self.hits += 1
+            node = self.free.pop()
+            node.data = data
+            return node
+        self.misses += 1
+        return self.node_class(data)
+
+    def release(self, node):
+        node.data = None  # Don't keep the element alive
+        node.next = None
+        if len(self.free) < self.max_size:
+            self.free.append(node)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
 class Queue:
-    def __init__(self, first_elem=None):
+    # pool_size > 0 recycles polled nodes through a NodePool of that size
+    def __init__(self, first_elem=None, pool_size=0):
+        self.pool = NodePool(self.Node, pool_size) if pool_size > 0 else None
         self.head = None
         self.tail = None
         self._size = 0
@@ -37,9 +69,12 @@ class Queue:
             if self.is_empty():
                 raise IndexError("Queue is empty")
 
-            data = self.head.data
-            self.head = self.head.next
+            polled_node = self.head
+            data = polled_node.data
+            self.head = polled_node.next
             self._size -= 1
+            if self.pool:
+                self.pool.release(polled_node)
 
             if self.is_empty():
                 self.tail = None
@@ -50,7 +85,7 @@ class Queue:
 
     # Add an element to the back of the queue
     def offer(self, elem):
-        new_node = self.Node(elem)
+        new_node = self.pool.acquire(elem) if self.pool else self.Node(elem)
 
         if self.is_empty():
             self.head = self.tail = new_node
@@ -0,0 +1,160 @@
+# data structures - ring buffer queue
+# Same API as Queue, backed by a circular list instead of one node per
+# element. The capacity is always a power of two so wrapping an index is
+# a bit mask (i & mask) rather than a modulo. The buffer doubles when
+# full and halves when a quarter full, batches are copied as at most two
+# contiguous slices, and every iteration gets its own cursor.
+class RingQueue:
+    MIN_CAPACITY = 8
+
+    def __init__(self, first_elem=None, capacity=16):
+        if capacity < 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        capacity = self._round_up(capacity)
+        self.arr = [None] * capacity
+        self.mask = capacity - 1
+        self.head = 0  # Slot of the front element
+        self._size = 0
+        self._mod_count = 0  # Lets iterators notice concurrent changes
+
+        if first_elem is not None:
+            self.offer(first_elem)
+
+    # Smallest power of two >= n (and >= MIN_CAPACITY)
+    @classmethod
+    def _round_up(cls, n):
+        return max(cls.MIN_CAPACITY, 1 << (n - 1).bit_length())
+
+    def capacity(self):
+        return self.mask + 1
+
+    # Move the elements to a new buffer of `capacity` slots, front at 0
+    def _resize(self, capacity):
+        self.arr = self._slice(self._size) + [None] * (capacity - self._size)
+        self.mask = capacity - 1
+        self.head = 0
+
+    # The first k elements as a list, copied with at most two slices
+    def _slice(self, k):
+        head, cap = self.head, self.mask + 1
+        first = min(k, cap - head)
+        return self.arr[head:head + first] + self.arr[:k - first]
+
+    def _maybe_shrink(self):
+        cap = self.mask + 1
+        if cap > self.MIN_CAPACITY and self._size <= cap // 4:
+            self._resize(max(self.MIN_CAPACITY, self._round_up(self._size * 2)))
+
+    # Return the size of the queue
+    def size(self):
+        return self._size
+
+    # Returns whether or not the queue is empty
+    def is_empty(self):
+        return self._size == 0
+
+    # Peek the element at the front of the queue
+    def peek(self):
+        try:
+            if self.is_empty():
+                raise IndexError("Queue is empty")
+            return self.arr[self.head]
+        except IndexError as e:
+            print("Error:", e)
+
+    # Poll an element from the front of the queue
+    def poll(self):
+        try:
+            size = self._size
+            if size == 0:
+                raise IndexError("Queue is empty")
+            arr, head, mask = self.arr, self.head, self.mask
+            data = arr[head]
+            arr[head] = None
+            self.head = (head + 1) & mask
+            self._size = size - 1
+            self._mod_count += 1
+            if size <= (mask + 1) >> 2:
+                self._maybe_shrink()
+            return data
+        except IndexError as e:
+            print("Error:", e)
+
+    # Poll up to k elements from the front, in queue order
+    def poll_many(self, k):
+        k = max(0, min(k, self._size))
+        items = self._slice(k)
+        head, cap = self.head, self.mask + 1
+        first = min(k, cap - head)
+        self.arr[head:head + first] = [None] * first
+        self.arr[:k - first] = [None] * (k - first)
+        self.head = (head + k) & self.mask
+        self._size -= k
+        self._mod_count += 1
+        self._maybe_shrink()
+        return items
+
+    # Add an element to the back of the queue
+    def offer(self, elem):
+        size, mask = self._size, self.mask
+        if size > mask:
+            self._resize((mask + 1) * 2)
+            mask = self.mask
+        self.arr[(self.head + size) & mask] = elem
+        self._size = size + 1
+        self._mod_count += 1
+
+    # Add every element of the iterable to the back of the queue
+    def offer_many(self, iterable):
+        items = list(iterable)
+        n = len(items)
+        if self._size + n > self.mask + 1:
+            self._resize(self._round_up(self._size + n))
+        cap = self.mask + 1
+        tail = (self.head + self._size) & self.mask
+        first = min(n, cap - tail)
+        self.arr[tail:tail + first] = items[:first]
+        self.arr[:n - first] = items[first:]
+        self._size += n
+        self._mod_count += 1
+
+    # Each call returns an independent iterator, front to back
+    def __iter__(self):
+        return RingQueueIterator(self)
+
+
+class RingQueueIterator:
+    def __init__(self, queue):
+        self.queue = queue
+        self.index = 0
+        self.expected_mod_count = queue._mod_count
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        queue = self.queue
+        if queue._mod_count != self.expected_mod_count:
+            raise RuntimeError("Queue changed during iteration")
+        if self.index >= queue._size:
+            raise StopIteration
+        data = queue.arr[(queue.head + self.index) & queue.mask]
+        self.index += 1
+        return data
+
+
+# Example usage
+if __name__ == "__main__":
+    queue = RingQueue()
+
+    queue.offer(1)
+    queue.offer_many([2, 3, 4, 5])
+
+    print(queue.peek())  # Output: 1
+    print(queue.poll())  # Output: 1
+    print(queue.poll_many(2))  # Output: [2, 3]
+
+    outer = iter(queue)
+    inner = iter(queue)
+    print(next(outer), next(inner), next(outer))  # Output: 4 4 5
+    print(queue.size(), queue.capacity())  # Output: 2 8
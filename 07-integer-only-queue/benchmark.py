@@ -0,0 +1,176 @@
+# Benchmarks for the integer queue, run with: python benchmark.py
+import asyncio
+import multiprocessing
+import random
+import time
+from collections import deque
+from timeit import timeit
+
+from asyncIntQueue import AsyncIntQueue
+from main import IntQueue
+from monotonicQueue import sliding_window_extrema
+from sharedIntQueue import SharedIntQueue
+
+
+# Moving n values through the queue one at a time vs in batches. The
+# growing queue starts small so the unwrap-on-grow path is included
+def bench_batch(n=200000, batch=256):
+    values = list(range(n))
+
+    def one_by_one(queue):
+        for v in values:
+            queue.enqueue(v)
+        for _ in range(n):
+            queue.dequeue()
+
+    def batched(queue):
+        for i in range(0, n, batch):
+            queue.enqueue_many(values[i:i + batch])
+        while queue.size():
+            queue.dequeue_many(batch)
+
+    print(f"n = {n}, batch = {batch} (s)")
+    print(f"{'':<24} {'single':>10} {'batched':>10}")
+    print(f"{'fixed capacity':<24} {timeit(lambda: one_by_one(IntQueue(n)), number=1):>10.4f}"
+          f" {timeit(lambda: batched(IntQueue(n)), number=1):>10.4f}")
+    print(f"{'auto_grow from 16':<24}"
+          f" {timeit(lambda: one_by_one(IntQueue(16, auto_grow=True)), number=1):>10.4f}"
+          f" {timeit(lambda: batched(IntQueue(16, auto_grow=True)), number=1):>10.4f}")
+
+
+# `tasks` producers and `tasks` consumers, -1 is the stop marker. A
+# consumer that pulls several markers in one batch hands the rest back
+async def async_throughput(queue, tasks, items, batch):
+    per_producer = items // tasks
+
+    async def produce():
+        for i in range(per_producer):
+            await queue.put(i)
+
+    async def consume():
+        count = 0
+        while True:
+            values = [await queue.get()] if batch == 1 else await queue.get_batch(batch, 0)
+            done = values.count(-1)
+            if done:
+                for _ in range(done - 1):
+                    await queue.put(-1)
+                return count + len(values) - done
+            count += len(values)
+
+    consumers = [asyncio.create_task(consume()) for _ in range(tasks)]
+    await asyncio.gather(*(produce() for _ in range(tasks)))
+    for _ in range(tasks):
+        await queue.put(-1)
+    assert sum(await asyncio.gather(*consumers)) == per_producer * tasks
+
+
+def bench_async(items=200000, capacity=1024):
+    def run(make_queue, tasks, batch):
+        return timeit(lambda: asyncio.run(async_throughput(make_queue(), tasks, items, batch)),
+                      number=1)
+
+    print(f"{items} values through an asyncio queue, N producers + N consumers (s)")
+    print(f"{'N':>4} {'asyncio.Queue':>14} {'AsyncIntQueue':>14} {'get_batch(64)':>14}")
+    for tasks in (1, 10, 100):
+        print(f"{tasks:>4} {run(lambda: asyncio.Queue(capacity), tasks, 1):>14.4f}"
+              f" {run(lambda: AsyncIntQueue(capacity), tasks, 1):>14.4f}"
+              f" {run(lambda: AsyncIntQueue(capacity), tasks, 64):>14.4f}")
+
+
+def _mp_consume(queue, n, batched):
+    received = 0
+    while received < n:
+        item = queue.get()
+        received += len(item) if batched else 1
+
+
+def _shared_consume(name, n, batched):
+    with SharedIntQueue.attach(name) as queue:
+        received = 0
+        while received < n:
+            if batched:
+                count = len(queue.dequeue_many(n - received))
+            else:
+                count = 0 if queue.dequeue() is None else 1
+            if count == 0:
+                time.sleep(0)  # Let the producer run instead of spinning
+            received += count
+
+
+# This process sends n integers to one consumer process, one at a time or
+# in batches. Either side of a SharedIntQueue yields its time
+# slice with sleep(0) when the queue is full / empty
+def bench_shared(n=200000, batch=256, capacity=4096):
+    values = list(range(n))
+
+    def mp_single(queue):
+        for v in values:
+            queue.put(v)
+
+    def mp_batched(queue):
+        for i in range(0, n, batch):
+            queue.put(values[i:i + batch])
+
+    def shared_single(queue):
+        enqueue = queue.enqueue
+        for v in values:
+            while not enqueue(v):
+                time.sleep(0)
+
+    def shared_batched(queue):
+        sent = 0
+        while sent < n:
+            count = queue.enqueue_many(values[sent:sent + batch])
+            if count == 0:
+                time.sleep(0)
+            sent += count
+
+    def time_mp(send, batched):
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_mp_consume, args=(queue, n, batched))
+        process.start()
+        return timeit(lambda: (send(queue), process.join()), number=1)
+
+    def time_shared(send, batched):
+        with SharedIntQueue(capacity) as queue:
+            process = multiprocessing.Process(target=_shared_consume, args=(queue.name, n, batched))
+            process.start()
+            return timeit(lambda: (send(queue), process.join()), number=1)
+
+    print(f"{n} integers from one process to another (s)")
+    print(f"{'':<24} {'single':>10} {f'batch {batch}':>10}")
+    print(f"{'multiprocessing.Queue':<24} {time_mp(mp_single, False):>10.4f}"
+          f" {time_mp(mp_batched, True):>10.4f}")
+    print(f"{'SharedIntQueue':<24} {time_shared(shared_single, False):>10.4f}"
+          f" {time_shared(shared_batched, True):>10.4f}")
+
+
+# Per-tick cost of rolling min/max over random latencies. The rescan is
+# O(k) per tick, so it is only timed over `naive_ticks` ticks once the
+# window is full; the monotonic deque runs over k + ticks values
+def bench_window(ticks=100000, naive_ticks=200, seed=1):
+    rng = random.Random(seed)
+    print("rolling min/max, microseconds per tick")
+    print(f"{'k':>9} {'rescan':>12} {'monotonic':>12}")
+    for k in (10, 100, 1000, 10000, 100000, 1000000):
+        values = [rng.randrange(1000) for _ in range(k + ticks)]
+        window = deque(values[:k - 1], maxlen=k)
+        tail = values[k - 1:k - 1 + naive_ticks]
+
+        def rescan():
+            for value in tail:
+                window.append(value)
+                min(window), max(window)
+
+        naive = timeit(rescan, number=1) / naive_ticks
+        fast = timeit(lambda: deque(sliding_window_extrema(values, k), maxlen=0),
+                      number=1) / len(values)
+        print(f"{k:>9} {naive * 1e6:>12.2f} {fast * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    bench_batch()
+    bench_async()
+    bench_shared()
+    bench_window()
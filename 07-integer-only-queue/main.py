@@ -1,20 +1,55 @@
+from array import array
+
+
 class IntQueue:
-    def __init__(self, max_size):
+    # The buffer is an array('q') whose length is always a power of two, so
+    # wrapping an index is a bit mask instead of a modulo. max_size is the
+    # logical limit: a full queue rejects new values, unless auto_grow is
+    # set, in which case the buffer is unwrapped into one twice as large
+    def __init__(self, max_size, auto_grow=False):
+        if max_size <= 0:
+            raise ValueError(f"Illegal max size: {max_size}")
         self.max_size = max_size
-        # One extra space to distinguish full from empty
-        self.ar = [0] * (max_size + 1)
+        self.auto_grow = auto_grow
+        self.ar = self._alloc(max_size)
+        self.mask = len(self.ar) - 1
         self.front = 0
-        self.end = 0
+        self.count = 0
+
+    # Zeroed array('q') of the smallest power of two >= n
+    @staticmethod
+    def _alloc(n):
+        capacity = 1 << (n - 1).bit_length()
+        return array("q", bytes(8 * capacity))
+
+    # The first k values as a new array, copied with at most two slices
+    def _slice(self, k):
+        first = min(k, len(self.ar) - self.front)
+        return self.ar[self.front:self.front + first] + self.ar[:k - first]
+
+    # Unwrap the values into a buffer with room for at least n values
+    def _grow(self, n):
+        new_ar = self._alloc(n)
+        new_ar[:self.count] = self._slice(self.count)
+        self.ar = new_ar
+        self.mask = len(new_ar) - 1
+        self.front = 0
+        self.max_size = len(new_ar)
+
+    # Make room for n more values or raise OverflowError
+    def _reserve(self, n):
+        if self.count + n > self.max_size:
+            if not self.auto_grow:
+                raise OverflowError("Queue too small!")
+            self._grow(max(self.count + n, 2 * self.max_size))
 
     # Returns true if the queue is empty
     def is_empty(self):
-        return self.front == self.end
+        return self.count == 0
 
     # Returns the number of elements inside the queue
     def size(self):
-        if self.front > self.end:
-            return (self.end + len(self.ar) - self.front)
-        return self.end - self.front
+        return self.count
 
     # Peek at the front element without removing it
     def peek(self):
@@ -30,11 +65,32 @@ class IntQueue:
         try:
             if not isinstance(value, int):
                 raise ValueError("Only integers are allowed")
-            if (self.end + 1) % len(self.ar) == self.front:
-                raise OverflowError("Queue too small!")
-            self.ar[self.end] = value
-            self.end = (self.end + 1) % len(self.ar)
-        except ValueError | OverflowError as e:
+            self._reserve(1)
+            self.ar[(self.front + self.count) & self.mask] = value
+            self.count += 1
+        except (ValueError, OverflowError) as e:
+            print("Error:", e)
+
+    # Add every value of seq to the end of the queue with at most two slice
+    # copies. The batch is type checked once, and it is added as a whole
+    # or not at all
+    def enqueue_many(self, seq):
+        if isinstance(seq, (bytes, bytearray)):
+            # array() would read these as raw memory, add the byte values
+            seq = list(seq)
+        try:
+            try:
+                batch = array("q", seq)
+            except TypeError:
+                raise ValueError("Only integers are allowed") from None
+            n = len(batch)
+            self._reserve(n)
+            tail = (self.front + self.count) & self.mask
+            first = min(n, len(self.ar) - tail)
+            self.ar[tail:tail + first] = batch[:first]
+            self.ar[:n - first] = batch[first:]
+            self.count += n
+        except (ValueError, OverflowError) as e:
             print("Error:", e)
 
     # Remove and return the element at the front of the queue
@@ -43,11 +99,20 @@ class IntQueue:
             if self.is_empty():
                 raise IndexError("Queue is empty")
             value = self.ar[self.front]
-            self.front = (self.front + 1) % len(self.ar)
+            self.front = (self.front + 1) & self.mask
+            self.count -= 1
             return value
         except IndexError as e:
             print("Error:", e)
 
+    # Remove up to k values from the front, returned as an array('q')
+    def dequeue_many(self, k):
+        k = max(0, min(k, self.count))
+        values = self._slice(k)
+        self.front = (self.front + k) & self.mask
+        self.count -= k
+        return values
+
 
 # Example usage
 if __name__ == "__main__":
@@ -76,3 +141,8 @@ if __name__ == "__main__":
     print(queue.dequeue())  # Output: 3
 
     print(queue.is_empty())  # Output: True
+
+    growing = IntQueue(4, auto_grow=True)
+    growing.enqueue_many(range(10))  # Grows instead of dropping values
+    print(growing.size(), growing.max_size)  # Output: 10 16
+    print(growing.dequeue_many(3).tolist())  # Output: [0, 1, 2]
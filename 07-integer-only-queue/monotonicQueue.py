@@ -0,0 +1,104 @@
+# data structures - monotonic queue
+# Sliding-window min / max in amortized O(1). Every pushed value gets the
+# next index (0, 1, 2, ...). The min deque keeps (index, value) pairs with
+# increasing values: a new value first pops every pair at the back that
+# is >= it, since those can never be the minimum again while it is in the
+# window. The max deque mirrors that. The front of each deque is then the
+# window's min / max, and expiring old indexes only ever pops the front.
+# Each value is pushed and popped at most once per deque.
+from collections import deque
+
+
+class MonotonicQueue:
+    def __init__(self):
+        self.min_q = deque()
+        self.max_q = deque()
+        self.next_index = 0
+        self.start = 0  # Oldest index still in the window
+
+    # Number of values in the window
+    def size(self):
+        return self.next_index - self.start
+
+    def is_empty(self):
+        return self.next_index == self.start
+
+    # Add a value to the window, returns its index
+    def push(self, value):
+        index = self.next_index
+        min_q, max_q = self.min_q, self.max_q
+        while min_q and min_q[-1][1] >= value:
+            min_q.pop()
+        min_q.append((index, value))
+        while max_q and max_q[-1][1] <= value:
+            max_q.pop()
+        max_q.append((index, value))
+        self.next_index = index + 1
+        return index
+
+    # Drop every value pushed before `index` from the window
+    def expire_before(self, index):
+        if index <= self.start:
+            return
+        self.start = min(index, self.next_index)
+        min_q, max_q = self.min_q, self.max_q
+        while min_q and min_q[0][0] < index:
+            min_q.popleft()
+        while max_q and max_q[0][0] < index:
+            max_q.popleft()
+
+    def window_min(self):
+        try:
+            if self.is_empty():
+                raise IndexError("Window is empty")
+            return self.min_q[0][1]
+        except IndexError as e:
+            print("Error:", e)
+
+    def window_max(self):
+        try:
+            if self.is_empty():
+                raise IndexError("Window is empty")
+            return self.max_q[0][1]
+        except IndexError as e:
+            print("Error:", e)
+
+
+# Yield (min, max) of every window of k consecutive values, one per value
+# from the k-th on. Same algorithm as MonotonicQueue, inlined for speed
+def sliding_window_extrema(iterable, k):
+    if k <= 0:
+        raise ValueError(f"Illegal window size: {k}")
+    min_q, max_q = deque(), deque()
+    for index, value in enumerate(iterable):
+        while min_q and min_q[-1][1] >= value:
+            min_q.pop()
+        min_q.append((index, value))
+        while max_q and max_q[-1][1] <= value:
+            max_q.pop()
+        max_q.append((index, value))
+        start = index - k + 1
+        if start < 0:
+            continue
+        if min_q[0][0] < start:
+            min_q.popleft()
+        if max_q[0][0] < start:
+            max_q.popleft()
+        yield min_q[0][1], max_q[0][1]
+
+
+# Example usage
+if __name__ == "__main__":
+    window = MonotonicQueue()
+    for latency in [5, 3, 8, 6, 1, 7]:
+        window.push(latency)
+
+    print(window.window_min(), window.window_max())  # Output: 1 8
+    window.expire_before(3)  # Keep indexes 3, 4, 5 -> [6, 1, 7]
+    print(window.window_min(), window.window_max())  # Output: 1 7
+    window.expire_before(5)  # Keep [7]
+    print(window.window_min(), window.window_max())  # Output: 7 7
+    print(window.size())  # Output: 1
+
+    print(list(sliding_window_extrema([5, 3, 8, 6, 1, 7], 3)))
+    # Output: [(3, 8), (3, 8), (1, 8), (1, 7)]
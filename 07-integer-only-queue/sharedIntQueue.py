@@ -0,0 +1,201 @@
+# data structures - shared memory integer queue
+# Single-producer / single-consumer IntQueue whose whole state lives in a
+# multiprocessing.shared_memory segment, so two processes can pass
+# integers without pickling them. The segment is a 3 slot int64 header,
+# [capacity, head, tail], followed by the power-of-two ring of values.
+# head and tail count the values ever dequeued / enqueued and only grow,
+# so size is tail - head and a slot is counter & mask. Only the producer
+# writes tail and only the consumer writes head, each after copying the
+# values, so no lock is needed for exactly one process on each side.
+# (That ordering relies on the CPU not reordering stores, as on x86.)
+import time
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+CAPACITY, HEAD, TAIL = 0, 1, 2
+HEADER = 3
+
+
+# Open a segment without leaving it registered with this process's
+# resource tracker. A tracker unlinks what is still registered when its
+# process exits, which would pull the segment away from the other side.
+# Python 3.13+ has track=False; older versions always register, so the
+# registration is undone (the same tracker may be shared with the other
+# process, so every register must be matched by exactly one unregister)
+def _open_untracked(name, create=False, size=0):
+    try:
+        return shared_memory.SharedMemory(name, create, size, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name, create, size)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+# Remove the segment. Before 3.13 unlink() also unregisters it, so it is
+# registered again first to keep the tracker balanced. A segment that is
+# already gone is not an error
+def _unlink_untracked(shm):
+    tracked = getattr(shm, "_track", True)
+    if tracked:
+        resource_tracker.register(shm._name, "shared_memory")
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        if tracked:
+            resource_tracker.unregister(shm._name, "shared_memory")
+
+
+class SharedIntQueue:
+    # Create a new segment with room for at least `capacity` values. name
+    # is picked by the OS when None; other processes attach() to it
+    def __init__(self, capacity, name=None):
+        if capacity <= 0:
+            raise ValueError(f"Illegal Capacity: {capacity}")
+        capacity = 1 << (capacity - 1).bit_length()
+        self._open(_open_untracked(name, create=True, size=8 * (HEADER + capacity)))
+        self.header[CAPACITY] = capacity
+        self.header[HEAD] = self.header[TAIL] = 0
+        self.mask = capacity - 1
+        self.owner = True  # Only the creator unlinks the segment
+
+    # Open the queue another process created under `name`. Only close()
+    # on the creating side frees the segment, whenever the others exit
+    @classmethod
+    def attach(cls, name):
+        queue = cls.__new__(cls)
+        queue._open(_open_untracked(name))
+        queue.mask = queue.header[CAPACITY] - 1
+        queue.owner = False
+        return queue
+
+    def _open(self, shm):
+        self.shm = shm
+        self.header = shm.buf[:8 * HEADER].cast("q")
+        self.ar = shm.buf[8 * HEADER:].cast("q")
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def capacity(self):
+        return self.mask + 1
+
+    def size(self):
+        return self.header[TAIL] - self.header[HEAD]
+
+    def is_empty(self):
+        return self.size() == 0
+
+    # Producer side. Add a value, returns False (and adds nothing) when
+    # the queue is full so the caller can back off and retry
+    def enqueue(self, value):
+        try:
+            if not isinstance(value, int):
+                raise ValueError("Only integers are allowed")
+            header = self.header
+            tail = header[TAIL]
+            if tail - header[HEAD] > self.mask:
+                return False
+            self.ar[tail & self.mask] = value
+            header[TAIL] = tail + 1
+            return True
+        except (ValueError, OverflowError) as e:
+            print("Error:", e)
+            return False
+
+    # Producer side. Add as many values from the front of seq as there is
+    # room for, with at most two slice copies. Returns how many were added
+    def enqueue_many(self, seq):
+        if isinstance(seq, (bytes, bytearray)):
+            # array() would read these as raw memory, add the byte values
+            seq = list(seq)
+        try:
+            try:
+                batch = array("q", seq)
+            except TypeError:
+                raise ValueError("Only integers are allowed") from None
+        except (ValueError, OverflowError) as e:
+            print("Error:", e)
+            return 0
+        header, mask = self.header, self.mask
+        tail = header[TAIL]
+        n = min(len(batch), mask + 1 - (tail - header[HEAD]))
+        start = tail & mask
+        first = min(n, mask + 1 - start)
+        self.ar[start:start + first] = batch[:first]
+        self.ar[:n - first] = batch[first:n]
+        header[TAIL] = tail + n
+        return n
+
+    # Consumer side. Remove and return the front value, None when empty
+    def dequeue(self):
+        header = self.header
+        head = header[HEAD]
+        if head == header[TAIL]:
+            return None
+        value = self.ar[head & self.mask]
+        header[HEAD] = head + 1
+        return value
+
+    # Consumer side. Remove up to k values, returned as an array('q')
+    def dequeue_many(self, k):
+        header, mask = self.header, self.mask
+        head = header[HEAD]
+        k = max(0, min(k, header[TAIL] - head))
+        start = head & mask
+        first = min(k, mask + 1 - start)
+        values = array("q")
+        values.frombytes(self.ar[start:start + first].cast("B"))
+        values.frombytes(self.ar[:k - first].cast("B"))
+        header[HEAD] = head + k
+        return values
+
+    # Detach from the segment; the creator also frees it
+    def close(self):
+        self.header.release()
+        self.ar.release()
+        self.shm.close()
+        if self.owner:
+            _unlink_untracked(self.shm)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Consumer process for the example below, sums `count` values
+def _consume(name, count, result):
+    with SharedIntQueue.attach(name) as queue:
+        total = received = 0
+        while received < count:
+            values = queue.dequeue_many(count - received)
+            if not values:
+                time.sleep(0)  # Empty, let the producer run
+            total += sum(values)
+            received += len(values)
+        result.value = total
+
+
+# Example usage
+if __name__ == "__main__":
+    from multiprocessing import Process, Value
+
+    with SharedIntQueue(4) as queue:
+        print(queue.enqueue_many([1, 2, 3, 4, 5]))  # Output: 4
+        print(queue.enqueue(6))  # Output: False
+        print(queue.dequeue())  # Output: 1
+        print(queue.dequeue_many(10).tolist())  # Output: [2, 3, 4]
+
+        result = Value("q", 0)
+        consumer = Process(target=_consume, args=(queue.name, 1000, result))
+        consumer.start()
+        sent = 0
+        while sent < 1000:
+            added = queue.enqueue_many(range(sent, min(sent + 64, 1000)))
+            if added == 0:
+                time.sleep(0)  # Full, let the consumer run
+            sent += added
+        consumer.join()
+        print(result.value)  # Output: 499500
@@ -0,0 +1,109 @@
+# Benchmarks for the binary heaps, run with: python benchmark.py
+import heapq
+import os
+import random
+import tempfile
+from array import array
+from collections import deque
+from timeit import timeit
+
+from maxHeap import MaxHeap
+from mergeSorted import merge_sorted, merge_sorted_files, read_sorted_ints
+from minHeap import MinHeap
+
+
+def build_by_insert(cls, values):
+    heap = cls()
+    for value in values:
+        heap.insert(value)
+    return heap
+
+
+# n inserts (O(n log n)) vs Floyd's bottom-up heapify (O(n)). heapq's C
+# heapify is the floor for the same algorithm
+def bench_build(sizes=(10000, 100000, 1000000), seed=1):
+    rng = random.Random(seed)
+    print("building a heap from n random values (s)")
+    print(f"{'n':>9} {'insert':>10} {'heapify':>10} {'max heapify':>12} {'heapq':>10}")
+    for n in sizes:
+        values = [rng.random() for _ in range(n)]
+        insert = timeit(lambda: build_by_insert(MinHeap, values), number=1)
+        floyd = timeit(lambda: MinHeap.heapify(values, copy=True), number=1)
+        floyd_max = timeit(lambda: MaxHeap.heapify(values, copy=True), number=1)
+        c_heapify = timeit(lambda: heapq.heapify(list(values)), number=1)
+        print(f"{n:>9} {insert:>10.4f} {floyd:>10.4f} {floyd_max:>12.4f} {c_heapify:>10.4f}")
+
+
+# n pushes then n pops, and n pushpop / replace on a heap of n values,
+# against the same operations from heapq (implemented in C)
+def bench_ops(n=200000, seed=1):
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(n)]
+
+    def push_pop_heap():
+        heap = MinHeap()
+        for value in values:
+            heap.insert(value)
+        for _ in values:
+            heap.extract_min()
+
+    def push_pop_heapq():
+        heap = []
+        for value in values:
+            heapq.heappush(heap, value)
+        for _ in values:
+            heapq.heappop(heap)
+
+    full = MinHeap.from_iterable(values)
+    full_q = list(values)
+    heapq.heapify(full_q)
+    print(f"n = {n} (s)")
+    print(f"{'':<24} {'MinHeap':>10} {'heapq':>10}")
+    print(f"{'push n, pop n':<24} {timeit(push_pop_heap, number=1):>10.4f}"
+          f" {timeit(push_pop_heapq, number=1):>10.4f}")
+    print(f"{'n pushpop':<24} {timeit(lambda: [full.pushpop(v) for v in values], number=1):>10.4f}"
+          f" {timeit(lambda: [heapq.heappushpop(full_q, v) for v in values], number=1):>10.4f}")
+    print(f"{'n replace':<24} {timeit(lambda: [full.replace(v) for v in values], number=1):>10.4f}"
+          f" {timeit(lambda: [heapq.heapreplace(full_q, v) for v in values], number=1):>10.4f}")
+
+
+def drain(iterator):
+    deque(iterator, maxlen=0)
+
+
+# Unbuffered baseline for read_sorted_ints: one 8 byte read per value
+def read_ints_one_by_one(path):
+    with open(path, "rb") as f:
+        while chunk := f.read(8):
+            yield int.from_bytes(chunk, "little", signed=True)
+
+
+# n values split over k sorted sources, in memory and as int64 files
+def bench_merge(n=1000000, seed=1):
+    rng = random.Random(seed)
+    print(f"merging n = {n} values from k sorted sources (s)")
+    print(f"{'k':>6} {'merge_sorted':>13} {'heapq.merge':>12} {'files':>10}"
+          f" {'heapq files':>12} {'unbuffered':>11}")
+    for k in (10, 100, 1000):
+        sources = [sorted(rng.randrange(1 << 40) for _ in range(n // k)) for _ in range(k)]
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i, source in enumerate(sources):
+                paths.append(os.path.join(tmp, f"shard{i}.bin"))
+                with open(paths[-1], "wb") as f:
+                    array("q", source).tofile(f)
+            ours = timeit(lambda: drain(merge_sorted(*sources)), number=1)
+            theirs = timeit(lambda: drain(heapq.merge(*sources)), number=1)
+            files = timeit(lambda: drain(merge_sorted_files(*paths)), number=1)
+            heapq_files = timeit(lambda: drain(heapq.merge(*map(read_sorted_ints, paths))),
+                                 number=1)
+            unbuffered = timeit(lambda: drain(merge_sorted(*map(read_ints_one_by_one, paths))),
+                                number=1)
+        print(f"{k:>6} {ours:>13.4f} {theirs:>12.4f} {files:>10.4f}"
+              f" {heapq_files:>12.4f} {unbuffered:>11.4f}")
+
+
+if __name__ == "__main__":
+    bench_build()
+    bench_ops()
+    bench_merge()
@@ -32,43 +32,116 @@ class MaxHeap:
     def swap(self, index1, index2):
         self.heap[index1], self.heap[index2] = self.heap[index2], self.heap[index1]
 
+    # Build a heap from any iterable in O(n), the items are copied into a
+    # new list
+    @classmethod
+    def from_iterable(cls, items):
+        return cls.heapify(list(items))
+
+    # Build a heap from a list in O(n). The heap takes the list over and
+    # reorders it in place; copy=True leaves the caller's list untouched
+    @classmethod
+    def heapify(cls, items, copy=False):
+        heap = cls()
+        heap.heap = list(items) if copy else items
+        heap._build()
+        return heap
+
+    # Floyd's bottom-up construction: sift down every parent, last one
+    # first. Leaves are already heaps, and most nodes sit near the bottom,
+    # so the total work is O(n) rather than the O(n log n) of n inserts.
+    # The heapify_down loop is inlined, half a call per element adds up
+    def _build(self):
+        heap = self.heap
+        n = len(heap)
+        for start in range(n // 2 - 1, -1, -1):
+            value = heap[start]
+            index = start
+            child = 2 * index + 1
+            while child < n:
+                if child + 1 < n and heap[child + 1] > heap[child]:
+                    child += 1
+                if not heap[child] > value:
+                    break
+                heap[index] = heap[child]
+                index = child
+                child = 2 * index + 1
+            heap[index] = value
+
     def insert(self, value):
         self.heap.append(value)
         self.heapify_up()
 
+    # Move the last element up to its place. The elements it passes are
+    # shifted down into the hole it leaves, and it is written only once
     def heapify_up(self):
-        index = len(self.heap) - 1
-        while self.has_parent(index) and self.parent(index) < self.heap[index]:
-            self.swap(self.get_parent_index(index), index)
-            index = self.get_parent_index(index)
+        heap = self.heap
+        index = len(heap) - 1
+        if index <= 0:
+            return
+        value = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not value > heap[parent]:
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = value
 
     def extract_max(self):
         try:
             if len(self.heap) == 0:
                 raise IndexError("Heap is empty")
 
-            if len(self.heap) == 1:
-                return self.heap.pop()
+            last = self.heap.pop()
+            if not self.heap:
+                return last
 
             max_value = self.heap[0]
-            self.heap[0] = self.heap.pop()
+            self.heap[0] = last
             self.heapify_down(0)
             return max_value
         except IndexError as e:
             print("Error:", e)
 
+    # Iterative sift-down with a hole: the largest child moves up into
+    # the hole until the element at `index` fits, then it is written once
     def heapify_down(self, index):
-        largest = index
-
-        if self.has_left_child(index) and self.left_child(index) > self.heap[largest]:
-            largest = self.get_left_child_index(index)
-
-        if self.has_right_child(index) and self.right_child(index) > self.heap[largest]:
-            largest = self.get_right_child_index(index)
+        heap = self.heap
+        n = len(heap)
+        value = heap[index]
+        child = 2 * index + 1
+        while child < n:
+            if child + 1 < n and heap[child + 1] > heap[child]:
+                child += 1
+            if not heap[child] > value:
+                break
+            heap[index] = heap[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
+
+    # Insert value then extract the max, in one sift. When value would
+    # come straight back out the heap isn't touched at all
+    def pushpop(self, value):
+        heap = self.heap
+        if heap and heap[0] > value:
+            value, heap[0] = heap[0], value
+            self.heapify_down(0)
+        return value
 
-        if largest != index:
-            self.swap(index, largest)
-            self.heapify_down(largest)
+    # Extract the max then insert value, in one sift. Unlike pushpop
+    # the returned element may be smaller than value
+    def replace(self, value):
+        try:
+            if len(self.heap) == 0:
+                raise IndexError("Heap is empty")
+            max_value = self.heap[0]
+            self.heap[0] = value
+            self.heapify_down(0)
+            return max_value
+        except IndexError as e:
+            print("Error:", e)
 
     def peek(self):
         try:
@@ -86,24 +159,31 @@ class MaxHeap:
 
 
 # Example usage:
-max_heap = MaxHeap()
-max_heap.insert(10)
-max_heap.insert(5)
-max_heap.insert(14)
-max_heap.insert(9)
-max_heap.insert(2)
+if __name__ == "__main__":
+    max_heap = MaxHeap()
+    max_heap.insert(10)
+    max_heap.insert(5)
+    max_heap.insert(14)
+    max_heap.insert(9)
+    max_heap.insert(2)
+
+    print(max_heap.peek())  # Output: 14
 
-print(max_heap.peek())  # Output: 14
+    print(max_heap.extract_max())  # Output: 14
+    print(max_heap.extract_max())  # Output: 10
+    print(max_heap.extract_max())  # Output: 9
 
-print(max_heap.extract_max())  # Output: 14
-print(max_heap.extract_max())  # Output: 10
-print(max_heap.extract_max())  # Output: 9
+    print(max_heap.size())  # Output: 2
 
-print(max_heap.size())  # Output: 2
+    print(max_heap.is_empty())  # Output: False
 
-print(max_heap.is_empty())  # Output: False
+    print(max_heap.extract_max())  # Output: 5
+    print(max_heap.extract_max())  # Output: 2
 
-print(max_heap.extract_max())  # Output: 5
-print(max_heap.extract_max())  # Output: 2
+    print(max_heap.is_empty())  # Output: True
 
-print(max_heap.is_empty())  # Output: True
+    data = [7, 3, 9, 1, 8, 2]
+    max_heap = MaxHeap.heapify(data)  # O(n), reorders data in place
+    print([max_heap.extract_max() for _ in range(3)])  # Output: [9, 8, 7]
+    print(max_heap.pushpop(10))  # Output: 10, larger than everything so never stored
+    print(max_heap.replace(10))  # Output: 3, then 10 is stored
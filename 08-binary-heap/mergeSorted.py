@@ -0,0 +1,80 @@
+# data structures - k-way merge
+# Lazily merge already sorted sources into one sorted stream. The heap
+# holds one pending entry per source, (key, order, value, iterator), so
+# memory is O(k) however long the sources are. order is the source's
+# position, it keeps equal keys in source order (a stable merge) and
+# means values and iterators are never compared. Ascending merges use
+# MinHeap, descending ones (sources sorted high to low) use MaxHeap.
+from array import array
+
+from maxHeap import MaxHeap
+from minHeap import MinHeap
+
+
+def merge_sorted(*iterables, key=None, reverse=False):
+    entries = []
+    # A MaxHeap prefers the larger order on ties, so count down there
+    direction = -1 if reverse else 1
+    for order, iterable in enumerate(iterables):
+        it = iter(iterable)
+        for value in it:
+            entries.append((value if key is None else key(value), order * direction, value, it))
+            break
+    heap = MaxHeap.heapify(entries) if reverse else MinHeap.heapify(entries)
+    pop = heap.extract_max if reverse else heap.extract_min
+
+    # heap.heap is entries; with one source left there is nothing to merge
+    while len(entries) > 1:
+        _, order, value, it = entries[0]
+        yield value
+        for value in it:
+            heap.replace((value if key is None else key(value), order, value, it))
+            break
+        else:
+            pop()  # Source exhausted
+    if entries:
+        _, _, value, it = entries[0]
+        yield value
+        yield from it
+
+
+# Buffered front end for a file of sorted native integers (as written by
+# array.tofile), read block_items values at a time instead of per value
+def read_sorted_ints(path, block_items=1 << 16, typecode="q"):
+    with open(path, "rb") as f:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(f, block_items)
+            except EOFError:
+                pass  # The values before the end of the file were still read
+            if not block:
+                return
+            yield from block
+
+
+# Merge sorted integer files into one sorted stream
+def merge_sorted_files(*paths, reverse=False, block_items=1 << 16, typecode="q"):
+    return merge_sorted(*(read_sorted_ints(path, block_items, typecode) for path in paths),
+                        reverse=reverse)
+
+
+# Example usage:
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    print(list(merge_sorted([1, 4, 7], [2, 5, 8], [3, 6, 9])))
+    # Output: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    print(list(merge_sorted([9, 5, 1], [8, 2], reverse=True)))  # Output: [9, 8, 5, 2, 1]
+    print(list(merge_sorted(["b", "dd"], ["a", "ccc"], key=len)))
+    # Output: ['b', 'a', 'dd', 'ccc']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, values in enumerate([[1, 10, 100], [5, 50], [7]]):
+            paths.append(os.path.join(tmp, f"shard{i}.bin"))
+            with open(paths[-1], "wb") as f:
+                array("q", values).tofile(f)
+        print(list(merge_sorted_files(*paths, block_items=2)))
+        # Output: [1, 5, 7, 10, 50, 100]